@@ -0,0 +1,77 @@
+"""Compare memory and speed of IdArray against list of Id objects.
+
+Run it from the project root directory:
+
+    python -m benchmarks.arrays
+"""
+from __future__ import annotations
+
+import random
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from wlss.shared.arrays import IdArray
+from wlss.shared.types import Id
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+SIZE = 100_000
+REPEAT = 5
+
+
+def measure_memory(factory: Callable[[], object]) -> int:
+    tracemalloc.start()
+    obj = factory()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def measure_time(statement: Callable[[], object]) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    generator = random.Random(42)
+    friends = [generator.randrange(SIZE * 10) for _ in range(SIZE)]
+    other_friends = [generator.randrange(SIZE * 10) for _ in range(SIZE)]
+
+    id_list, other_id_list = [Id(value) for value in friends], [Id(value) for value in other_friends]
+    id_array, other_id_array = IdArray(friends), IdArray(other_friends)
+    id_set = set(id_list)
+
+    rows = [
+        (
+            "memory, bytes",
+            measure_memory(lambda: [Id(value) for value in friends]),
+            measure_memory(lambda: IdArray(friends)),
+        ),
+        (
+            "construction, s",
+            measure_time(lambda: [Id(value) for value in friends]),
+            measure_time(lambda: IdArray(friends)),
+        ),
+        (
+            "1000 membership tests, s",
+            measure_time(lambda: [Id(value) in id_set for value in other_friends[:1000]]),
+            measure_time(lambda: [value in id_array for value in other_friends[:1000]]),
+        ),
+        (
+            "intersection, s",
+            measure_time(lambda: set(id_list).intersection(other_id_list)),
+            measure_time(lambda: id_array & other_id_array),
+        ),
+    ]
+
+    print(f"{SIZE} items")  # noqa: T201
+    print(f"{'':<28}{'list[Id]':>16}{'IdArray':>16}")  # noqa: T201
+    for name, list_result, array_result in rows:
+        print(f"{name:<28}{list_result:>16.6g}{array_result:>16.6g}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Report worst-case latency of validation of every type over generated corpus of inputs.
+
+Run it from the project root directory:
+
+    python -m benchmarks.latency --budget-us 50
+
+Exit status is 1 if any sample is validated longer than the budget.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+
+from wlss.core.export import iter_types
+from wlss.core.latency import BUDGET_NS, measure_latency, REPEAT
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-us", type=float, default=BUDGET_NS / 1000, help="latency budget in microseconds")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="number of times every sample is validated")
+    parser.add_argument("--seed", type=int, default=0, help="seed of corpus generator")
+    args = parser.parse_args()
+
+    report = measure_latency(iter_types(), budget_ns=int(args.budget_us * 1000), repeat=args.repeat, seed=args.seed)
+
+    print(report.format())  # noqa: T201
+    sys.exit(1 if report.outliers else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare pydantic model validation with native pydantic-core schemas of 'wlss' types and with python validators.
+
+Run it from the project root directory (requires 'pydantic' extra):
+
+    python -m benchmarks.pydantic
+"""
+from __future__ import annotations
+
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import BaseModel, PlainValidator
+
+from wlss.account.types import AccountEmail
+from wlss.profile.types import ProfileName
+from wlss.shared.types import Id, UtcDatetime
+from wlss.wish.types import WishDescription
+
+
+NUMBER = 20_000
+REPEAT = 5
+
+
+class NativeWish(BaseModel):
+    id: Id
+    owner_email: AccountEmail
+    owner_name: ProfileName
+    description: WishDescription
+    created_at: UtcDatetime
+
+
+class PythonWish(BaseModel):
+    id: Annotated[Id, PlainValidator(Id)]
+    owner_email: Annotated[AccountEmail, PlainValidator(AccountEmail)]
+    owner_name: Annotated[ProfileName, PlainValidator(ProfileName)]
+    description: Annotated[WishDescription, PlainValidator(WishDescription)]
+    created_at: Annotated[UtcDatetime, PlainValidator(UtcDatetime)]
+
+
+def measure_time(model: type[BaseModel], data: dict[str, object]) -> float:
+    return min(timeit.repeat(lambda: model.model_validate(data), number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    data: dict[str, object] = {
+        "id": 42,
+        "owner_email": "john.doe@mail.com",
+        "owner_name": "John Doe",
+        "description": "Lorem ipsum dolor sit amet. " * 20,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    }
+    json_data = json.dumps({**data, "created_at": "2024-01-01T00:00:00Z"})
+
+    print(f"{'':<24}{'python, us':>16}{'native, us':>16}")  # noqa: T201
+    print(  # noqa: T201
+        f"{'validate python':<24}"
+        f"{measure_time(PythonWish, data) * 1e6:>16.3f}"
+        f"{measure_time(NativeWish, data) * 1e6:>16.3f}",
+    )
+    # python validation of 'wlss' types accepts only python objects, so only native schemas can validate JSON
+    json_time = min(timeit.repeat(lambda: NativeWish.model_validate_json(json_data), number=NUMBER, repeat=REPEAT))
+    print(f"{'validate json':<24}{'-':>16}{json_time / NUMBER * 1e6:>16.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
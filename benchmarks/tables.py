@@ -0,0 +1,138 @@
+"""Compare per-worker memory, warm-up and lookups of AccountLoginTable against set of AccountLogin objects.
+
+Memory is measured as growth of proportional set size (PSS) of forked worker processes, so pages of the table
+file shared by workers are split between them. It requires Linux ("/proc/self/smaps_rollup").
+
+Run it from the project root directory:
+
+    python -m benchmarks.tables
+"""
+from __future__ import annotations
+
+import multiprocessing
+import random
+import re
+import string
+import tempfile
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wlss.account.tables import AccountLoginTable
+from wlss.account.types import AccountLogin
+
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Callable
+
+
+SIZE = 100_000
+REPEAT = 5
+WORKERS = 4
+
+
+def read_pss() -> int:
+    """Return proportional set size of the current process in bytes."""
+    match = re.search(r"^Pss:\s+(\d+) kB$", Path("/proc/self/smaps_rollup").read_text(), flags=re.MULTILINE)
+    assert match is not None
+    return int(match.group(1)) * 1024
+
+
+def run_worker(
+    load: Callable[[], Callable[[], object]],
+    barrier: threading.Barrier,
+    queue: multiprocessing.Queue[int],
+) -> None:
+    # pages shared with the parent are split between all workers, so they have to exist before the first measurement
+    barrier.wait()
+    pss = read_pss()
+    # the returned callable touches all the data, as lookups of a long-running worker eventually do
+    touch = load()
+    touch()
+    # pages of the table are split between workers only when all of them have touched the pages
+    barrier.wait()
+    pss = read_pss() - pss
+    # workers which exit stop sharing pages, so all of them wait until every worker is measured
+    barrier.wait()
+    queue.put(pss)
+
+
+def measure_memory(load: Callable[[], Callable[[], object]]) -> int:
+    """Return average growth of PSS of workers which load data at the same time."""
+    context = multiprocessing.get_context("fork")
+    queue: multiprocessing.Queue[int] = context.Queue()
+    barrier = context.Barrier(WORKERS)
+    workers = [context.Process(target=run_worker, args=(load, barrier, queue)) for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return sum(results) // len(results)
+
+
+def measure_time(statement: Callable[[], object]) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    generator = random.Random(42)
+    alphabet = string.ascii_letters + string.digits
+    logins = ["".join(generator.choices(alphabet, k=generator.randint(5, 20))) for _ in range(SIZE)]
+    # both collections are looked up by the same objects, so validation of inputs isn't measured
+    other_logins = [
+        AccountLogin(login) for login in logins[:500] + ["".join(generator.choices(alphabet, k=10)) for _ in range(500)]
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = Path(directory) / "logins.txt"
+        text_path.write_text("\n".join(logins))
+        table_path = Path(directory) / "logins.table"
+        AccountLoginTable.build(table_path, logins)
+
+        def load_set() -> set[AccountLogin]:
+            return {AccountLogin(login) for login in text_path.read_text().split("\n")}
+
+        def open_table() -> None:
+            AccountLoginTable.open(table_path).close()
+
+        def load_set_in_worker() -> Callable[[], object]:
+            login_set = load_set()
+            # items of the worker's own data are looked up, so objects inherited from the parent aren't touched
+            return lambda: sum(login in login_set for login in login_set)
+
+        def open_table_in_worker() -> Callable[[], object]:
+            # the table stays open until the worker exits
+            table = AccountLoginTable.open(table_path)
+            # items of the worker's own data are looked up, so objects inherited from the parent aren't touched
+            return lambda: sum(login in table for login in table)
+
+        login_set = load_set()
+        with AccountLoginTable.open(table_path) as login_table:
+            rows = [
+                (
+                    f"PSS per worker ({WORKERS}), bytes",
+                    measure_memory(load_set_in_worker),
+                    measure_memory(open_table_in_worker),
+                ),
+                (
+                    "warm-up per worker, s",
+                    measure_time(load_set),
+                    measure_time(open_table),
+                ),
+                (
+                    "1000 membership tests, s",
+                    measure_time(lambda: [login in login_set for login in other_logins]),
+                    measure_time(lambda: [login in login_table for login in other_logins]),
+                ),
+            ]
+
+    print(f"{SIZE} items")  # noqa: T201
+    print(f"{'':<28}{'set[AccountLogin]':>20}{'AccountLoginTable':>20}")  # noqa: T201
+    for name, set_result, table_result in rows:
+        print(f"{name:<28}{set_result:>20.6g}{table_result:>20.6g}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
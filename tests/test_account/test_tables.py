@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from wlss.account.tables import AccountLoginTable  # noqa: F401
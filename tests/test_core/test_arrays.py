@@ -0,0 +1,239 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+import pytest
+from typing_extensions import override
+
+from wlss.core.arrays import IntArray, ITEM_MAX
+from wlss.core.exceptions import ValidationError
+from wlss.core.types import Int, PositiveInt
+
+
+class MyInt(PositiveInt):
+    VALUE_MAX = Int(100)
+
+
+class MyIntArray(IntArray[MyInt]):
+    TYPE = MyInt
+
+
+class WideInt(MyInt):
+    VALUE_MIN = Int(-5)
+
+
+class WideIntArray(IntArray[WideInt]):
+    TYPE = WideInt
+
+
+class EvenInt(Int):
+    @override
+    @classmethod
+    def validate(cls: type[EvenInt], value: int) -> int:
+        if value % 2:
+            msg = f"{cls.__name__} value should be even."
+            raise ValidationError(msg)
+        return value
+
+
+class EvenIntArray(IntArray[EvenInt]):
+    TYPE = EvenInt
+
+
+class EvenMinInt(Int):
+    @override
+    @classmethod
+    def validate_value_min(cls: type[EvenMinInt], value: int) -> int:
+        if value % 2:
+            msg = f"{cls.__name__} value should be even."
+            raise ValidationError(msg)
+        return value
+
+
+class EvenMinIntArray(IntArray[EvenMinInt]):
+    TYPE = EvenMinInt
+
+
+class PlainIntArray(IntArray[Int]):
+    TYPE = Int
+
+
+class Test_IntArray:  # noqa: N801
+
+    @staticmethod
+    def test_when_initialized_by_integers_and_objects_of_type_Type():
+        result = MyIntArray([1, MyInt(2), Int(3)])
+
+        assert result.tolist() == [1, 2, 3]
+        assert len(result) == 3
+
+    @staticmethod
+    def test_when_initialized_without_values():
+        result = MyIntArray()
+
+        assert result.tolist() == []
+
+    @staticmethod
+    def test_when_value_greater_than_VALUE_MAX():
+        with pytest.raises(ValidationError) as exc_info:
+            MyIntArray([1, 101, -1])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == ("MyInt value should not be greater than 100.", )
+
+    @staticmethod
+    def test_when_value_less_than_VALUE_MIN():
+        with pytest.raises(ValidationError) as exc_info:
+            MyIntArray([1, -1, 101])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == ("MyInt value should not be less than 0.", )
+
+    @staticmethod
+    def test_when_value_does_not_fit_machine_integer():
+        with pytest.raises(ValidationError) as exc_info:
+            PlainIntArray([1, ITEM_MAX + 1])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == (
+            "PlainIntArray value should be in range [-9223372036854775808, 9223372036854775807].",
+        )
+
+    @staticmethod
+    def test_when_type_has_custom_validation():
+        assert EvenIntArray([2, 4]).tolist() == [2, 4]
+
+        with pytest.raises(ValidationError) as exc_info:
+            EvenIntArray([2, 3, 4])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == ("EvenInt value should be even.", )
+
+    @staticmethod
+    def test_when_type_has_custom_rule():
+        with pytest.raises(ValidationError) as exc_info:
+            EvenMinIntArray([2, 3, 4])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == ("EvenMinInt value should be even.", )
+
+    @staticmethod
+    def test_when_extended_by_array_of_the_same_type():
+        result = MyIntArray([1])
+
+        result.extend(MyIntArray([2, 3]))
+
+        assert result.tolist() == [1, 2, 3]
+
+    @staticmethod
+    def test_when_extended_by_array_of_another_type():
+        result = MyIntArray([1])
+
+        with pytest.raises(ValidationError) as exc_info:
+            result.extend(PlainIntArray([2, 300]))
+
+        assert exc_info.value.args == ("MyInt value should not be greater than 100.", )
+        assert result.tolist() == [1]
+
+    @staticmethod
+    def test_when_extended_by_array_of_subclass_with_looser_rules():
+        result = MyIntArray([1])
+
+        with pytest.raises(ValidationError) as exc_info:
+            result.extend(WideIntArray([2, -3]))
+
+        assert exc_info.value.args == ("MyInt value should not be less than 0.", )
+        assert result.tolist() == [1]
+
+    @staticmethod
+    def test_when_value_is_appended():
+        result = MyIntArray([1])
+
+        assert 2 not in result
+        result.append(2)
+        assert 2 in result
+
+    @staticmethod
+    def test_when_membership_is_tested():
+        result = MyIntArray([5, 3, 1])
+
+        assert 3 in result
+        assert MyInt(3) in result
+        assert 4 not in result
+        assert 42 not in result
+        assert Int(3) not in result
+        assert "3" not in result
+
+    @staticmethod
+    def test_when_items_are_accessed():
+        result = MyIntArray([1, 2, 3])
+
+        assert result[0] == MyInt(1)
+        assert type(result[-1]) is MyInt
+        assert result[1:] == MyIntArray([2, 3])
+        assert list(result) == [MyInt(1), MyInt(2), MyInt(3)]
+
+    @staticmethod
+    def test_when_items_are_accessed_without_validation(monkeypatch):
+        def validate(cls: type[MyInt], value: int) -> int:
+            pytest.fail("Value is validated again.")
+
+        result = MyIntArray([1, 2, 3])
+        monkeypatch.setattr(MyInt, "validate", classmethod(validate))
+
+        assert result[0].value == 1
+        assert [item.value for item in result] == [1, 2, 3]
+
+    @staticmethod
+    def test_when_type_normalizes_values():
+        class AbsInt(Int):
+            @override
+            @classmethod
+            def validate(cls: type[AbsInt], value: int) -> int:
+                return abs(value)
+
+        class AbsIntArray(IntArray[AbsInt]):
+            TYPE = AbsInt
+
+        result = AbsIntArray([-1, 2])
+
+        assert result.tolist() == [1, 2]
+        assert result[0] == AbsInt(1)
+
+    @staticmethod
+    def test_when_set_operations_are_applied():
+        foo = MyIntArray([4, 1, 2, 3, 3])
+        bar = MyIntArray([5, 3, 4, 6])
+
+        assert (foo & bar).tolist() == [3, 4]
+        assert (foo | bar).tolist() == [1, 2, 3, 4, 5, 6]
+        assert (foo - bar).tolist() == [1, 2]
+        assert type(foo & bar) is MyIntArray
+
+    @staticmethod
+    def test_when_union_with_array_of_another_type():
+        with pytest.raises(ValidationError) as exc_info:
+            MyIntArray([1]) | PlainIntArray([-1])
+
+        assert exc_info.value.args == ("MyInt value should not be less than 0.", )
+
+    @staticmethod
+    def test_when_union_with_array_of_subclass_with_looser_rules():
+        with pytest.raises(ValidationError) as exc_info:
+            MyIntArray([1, 2]) | WideIntArray([-3])
+
+        assert exc_info.value.args == ("MyInt value should not be less than 0.", )
+
+    @staticmethod
+    def test_when_array_compared_to_another_array():
+        assert MyIntArray([1, 2]) == MyIntArray([1, 2])
+        assert MyIntArray([1, 2]) != MyIntArray([2, 1])
+        assert MyIntArray([1, 2]) != PlainIntArray([1, 2])
+
+    @staticmethod
+    def test_when_array_is_hashed():
+        with pytest.raises(TypeError):
+            hash(MyIntArray())
+
+    @staticmethod
+    def test_when_array_is_represented():
+        assert repr(MyIntArray([1, 2])) == "MyIntArray([1, 2])"
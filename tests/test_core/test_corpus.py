@@ -0,0 +1,174 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from wlss.account.types import AccountEmail
+from wlss.core.corpus import _extract_literals, generate_corpus, TYPICAL_SIZE
+from wlss.core.types import Int, NaiveDatetime, PositiveInt, Str, Type
+from wlss.profile.types import ProfileDescription, ProfileName
+from wlss.shared.types import UtcDatetime
+
+
+def get_descriptions(type_: type[Type[Any]], category: str) -> list[str]:
+    return [sample.description for sample in generate_corpus(type_) if sample.category == category]
+
+
+class Test_generate_corpus:  # noqa: N801
+
+    @staticmethod
+    def test_when_corpus_is_generated_twice():
+        assert generate_corpus(AccountEmail) == generate_corpus(AccountEmail)
+        assert generate_corpus(AccountEmail, seed=1) != generate_corpus(AccountEmail)
+
+    @staticmethod
+    def test_when_type_is_Int():
+        class MyInt(PositiveInt):
+            VALUE_MAX = Int(10)
+
+        result = generate_corpus(MyInt)
+
+        typical = [sample.value for sample in result if sample.category == "typical"]
+        assert len(typical) == TYPICAL_SIZE
+        assert all(0 <= value <= 10 for value in typical)
+        assert [sample.value for sample in result if sample.category == "boundary"] == [-1, 0, 1, 9, 10, 11]
+        assert get_descriptions(MyInt, "adversarial") == [
+            "huge positive integer",
+            "huge negative integer",
+            "integer out of signed 64-bit range",
+        ]
+
+    @staticmethod
+    def test_when_type_is_Int_without_rules():
+        assert get_descriptions(Int, "boundary") == []
+        assert len(get_descriptions(Int, "typical")) == TYPICAL_SIZE
+
+    @staticmethod
+    def test_when_type_is_Str_with_structured_REGEXP():
+        result = generate_corpus(AccountEmail)
+
+        typical = [sample.value for sample in result if sample.category == "typical"]
+        assert len(typical) == TYPICAL_SIZE
+        assert all(AccountEmail.REGEXP.fullmatch(value) for value in typical)
+        assert [len(sample.value) for sample in result if sample.category == "boundary"] == [4, 5, 200, 201]
+        adversarial = {sample.description: sample.value for sample in result if sample.category == "adversarial"}
+        assert adversarial["near miss, repeated '@'"] == "a@" * 100
+        assert adversarial["near miss, repeated '.' ends with '\\n'"] == "a." * 99 + "a\n"
+        assert len(adversarial["length 20000"]) == 20_000
+
+    @staticmethod
+    def test_when_type_is_Str_with_character_class_REGEXP():
+        result = generate_corpus(ProfileName)
+
+        typical = [sample.value for sample in result if sample.category == "typical"]
+        assert all(ProfileName.REGEXP.fullmatch(value) for value in typical)
+        assert [sample.value for sample in result if sample.category == "boundary"][1] == "a"
+        adversarial = {sample.description: sample.value for sample in result if sample.category == "adversarial"}
+        assert len(adversarial["multi-byte cyrillic characters"]) == 50
+        assert adversarial["near miss, ends with '\\n'"] == "a" * 49 + "\n"
+        assert not any(description.startswith("near miss, repeated") for description in adversarial)
+
+    @staticmethod
+    def test_when_type_is_Str_with_DOTALL_REGEXP():
+        assert get_descriptions(ProfileDescription, "adversarial") == [
+            "length 100000",
+            "multi-byte cyrillic characters",
+            "astral plane characters",
+        ]
+
+    @staticmethod
+    def test_when_type_is_Str_without_rules():
+        assert get_descriptions(Str, "boundary") == ["length 0"]
+        assert "length 3200" in get_descriptions(Str, "adversarial")
+
+    @staticmethod
+    def test_when_valid_value_cannot_be_generated():
+        class MyStr(Str):
+            LENGTH_MAX = PositiveInt(5)
+            REGEXP = re.compile(r"\d{10}")
+
+        assert get_descriptions(MyStr, "typical") == []
+
+    @staticmethod
+    def test_when_type_is_NaiveDatetime():
+        class MyDatetime(NaiveDatetime):
+            VALUE_MIN = NaiveDatetime(datetime(2000, 1, 1))  # noqa: DTZ001
+            VALUE_MAX = NaiveDatetime(datetime(2001, 1, 1))  # noqa: DTZ001
+
+        result = generate_corpus(MyDatetime)
+
+        typical = [sample.value for sample in result if sample.category == "typical"]
+        assert len(typical) == TYPICAL_SIZE
+        assert all(value.tzinfo is None for value in typical)
+        assert [sample.value for sample in result if sample.category == "boundary"][:2] == [
+            datetime(1999, 12, 31, 23, 59, 59, 999999),  # noqa: DTZ001
+            datetime(2000, 1, 1),  # noqa: DTZ001
+        ]
+        assert get_descriptions(MyDatetime, "adversarial") == [
+            "earliest datetime",
+            "latest datetime",
+            "timezone UTC",
+            "timezone UTC+03:00",
+        ]
+
+    @staticmethod
+    def test_when_datetime_limits_are_the_earliest_and_the_latest_datetime():
+        class MyDatetime(NaiveDatetime):
+            VALUE_MIN = NaiveDatetime(datetime.min)
+            VALUE_MAX = NaiveDatetime(datetime.max)
+
+        assert get_descriptions(MyDatetime, "boundary") == [
+            "VALUE_MIN +0 microsecond",
+            "VALUE_MIN +1 microsecond",
+            "VALUE_MAX -1 microsecond",
+            "VALUE_MAX +0 microsecond",
+        ]
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime_with_TIMEZONE():
+        class MyDatetime(UtcDatetime):
+            TIMEZONE = timezone(timedelta(hours=3))
+
+        typical = [sample.value for sample in generate_corpus(MyDatetime) if sample.category == "typical"]
+
+        assert len(typical) == TYPICAL_SIZE
+        assert all(value.tzinfo == timezone(timedelta(hours=3)) for value in typical)
+        assert get_descriptions(MyDatetime, "adversarial") == [
+            "earliest datetime",
+            "latest datetime",
+            "timezone None",
+            "timezone UTC",
+        ]
+
+    @staticmethod
+    def test_when_type_cannot_be_used_to_generate_corpus():
+        class MyType(Type[bytes]):
+            @override
+            @classmethod
+            def validate(cls: type[MyType], value: bytes) -> bytes:
+                return value
+
+        with pytest.raises(TypeError) as exc_info:
+            generate_corpus(MyType)
+
+        assert exc_info.value.args == ("MyType cannot be used to generate corpus.", )
+
+
+class Test_extract_literals:  # noqa: N801
+
+    @staticmethod
+    def test_when_literals_are_extracted():
+        result = _extract_literals(re.compile(r"a\.\d[\]@]+(b|c)?[]x][^]y]-"))
+
+        assert result == ["a", ".", "b", "c", "-"]
+
+    @staticmethod
+    def test_when_REGEXP_has_repetition_bounds():
+        result = _extract_literals(re.compile(r"a{2}b{1,10}c{,3}\{d{e}"))
+
+        assert result == ["a", "b", "c", "{", "d", "{", "e", "}"]
@@ -0,0 +1,396 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from typing_extensions import override
+
+from wlss.core.exceptions import ValidationError
+from wlss.core.export import export_json_schema, export_sql_check, Inexact, iter_types
+from wlss.core.types import AwareDatetime, Int, NaiveDatetime, PositiveInt, Str, Type
+from wlss.profile.types import ProfileDescription, ProfileName
+from wlss.shared.types import Id, UtcDatetime
+
+
+class EvenInt(PositiveInt):
+    VALUE_MAX = Int(10)
+
+    @override
+    @classmethod
+    def validate(cls: type[EvenInt], value: int) -> int:
+        if value % 2:
+            msg = "EvenInt value should be even."
+            raise ValidationError(msg)
+        return super().validate(value)
+
+
+class LowercaseStr(Str):
+    LENGTH_MAX = PositiveInt(10)
+    REGEXP = re.compile(r"[a-z]*")
+
+    @override
+    @classmethod
+    def validate_regexp(cls: type[LowercaseStr], value: str) -> str:
+        return super().validate_regexp(value.lower())
+
+
+class StrippedStr(Str):
+    LENGTH_MIN = PositiveInt(1)
+
+    @override
+    @classmethod
+    def validate_length_min(cls: type[StrippedStr], value: str) -> str:
+        return super().validate_length_min(value.strip())
+
+
+class NotUtcDatetime(AwareDatetime):
+    VALUE_MAX = AwareDatetime(datetime(2100, 1, 1, tzinfo=timezone.utc))
+
+    @override
+    @classmethod
+    def validate_timezone(cls: type[NotUtcDatetime], value: datetime) -> datetime:
+        if value.utcoffset() == timedelta(0):
+            msg = "NotUtcDatetime value should not be in UTC."
+            raise ValidationError(msg)
+        return super().validate_timezone(value)
+
+
+class Test_iter_types:  # noqa: N801
+
+    @staticmethod
+    def test_when_types_are_iterated():
+        class MyInt(Int):
+            ...
+
+        result = list(iter_types())
+
+        assert Id in result
+        assert ProfileName in result
+        assert MyInt not in result
+        assert Type not in result
+        assert result == sorted(result, key=lambda type_: type_.__name__)
+
+
+class Test_export_json_schema:  # noqa: N801
+
+    @staticmethod
+    def test_when_type_is_Int():
+        class MyInt(Int):
+            VALUE_MIN = Int(1)
+            VALUE_MAX = Int(10)
+
+        result = export_json_schema(MyInt)
+
+        assert result.schema == {"title": "MyInt", "type": "integer", "minimum": 1, "maximum": 10}
+        assert result.inexact == ()
+
+    @staticmethod
+    def test_when_validate_is_overridden():
+        result = export_json_schema(EvenInt)
+
+        assert result.schema == {"title": "EvenInt", "type": "integer"}
+        assert result.inexact == (
+            Inexact(rule="VALUE_MIN", reason="Overridden 'validate' method cannot be exported."),
+            Inexact(rule="VALUE_MAX", reason="Overridden 'validate' method cannot be exported."),
+        )
+
+    @staticmethod
+    def test_when_type_is_Int_without_rules():
+        result = export_json_schema(Int)
+
+        assert result.schema == {"title": "Int", "type": "integer"}
+
+    @staticmethod
+    def test_when_type_is_Str():
+        result = export_json_schema(ProfileName)
+
+        assert result.schema == {
+            "title": "ProfileName",
+            "type": "string",
+            "minLength": 1,
+            "maxLength": 50,
+            "pattern": "^(?:[A-Za-zА-яЁё'-.() ]*)$",  # noqa: RUF001
+        }
+        assert result.inexact == ()
+
+    @staticmethod
+    def test_when_type_is_Str_without_rules():
+        result = export_json_schema(Str)
+
+        assert result.schema == {"title": "Str", "type": "string", "minLength": 0}
+
+    @staticmethod
+    def test_when_rule_is_overridden():
+        result = export_json_schema(LowercaseStr)
+
+        assert result.schema == {"title": "LowercaseStr", "type": "string", "minLength": 0, "maxLength": 10}
+        assert result.inexact == (
+            Inexact(rule="REGEXP", reason="Overridden 'validate_regexp' method cannot be exported."),
+        )
+
+    @staticmethod
+    def test_when_LENGTH_MIN_rule_is_overridden():
+        result = export_json_schema(StrippedStr)
+
+        assert result.schema == {"title": "StrippedStr", "type": "string"}
+        assert [inexact.rule for inexact in result.inexact] == ["LENGTH_MIN"]
+
+    @staticmethod
+    def test_when_REGEXP_has_dot():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a.b")
+
+        result = export_json_schema(MyStr)
+
+        assert result.schema["pattern"] == r"^(?:a[^\n]b)$"
+
+    @staticmethod
+    def test_when_REGEXP_has_dot_with_DOTALL_flag():
+        result = export_json_schema(ProfileDescription)
+
+        assert result.schema["pattern"] == r"^(?:[\s\S]{1,1000})$"
+        assert result.inexact == ()
+
+    @staticmethod
+    def test_when_REGEXP_has_dot_within_character_class():
+        class MyStr(Str):
+            REGEXP = re.compile(r"[]a.][^].]\.")
+
+        result = export_json_schema(MyStr)
+
+        assert result.schema["pattern"] == r"^(?:[]a.][^].]\.)$"
+
+    @staticmethod
+    def test_when_REGEXP_has_repetition_bounds():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a{,3}b{2,}c{1,2}d{,}e{}")
+
+        result = export_json_schema(MyStr)
+
+        assert result.schema["pattern"] == r"^(?:a{0,3}b{2,}c{1,2}d{0,}e{})$"
+
+    @staticmethod
+    def test_when_REGEXP_has_inexact_constructs():
+        class MyStr(Str):
+            REGEXP = re.compile(r"(?P<digit>\d)", flags=re.IGNORECASE)
+
+        result = export_json_schema(MyStr)
+
+        assert result.inexact == (
+            Inexact(rule="REGEXP", reason="Only re.DOTALL flag can be exported."),
+            Inexact(rule="REGEXP", reason="Only non-capturing '(?:...)' groups can be exported."),
+            Inexact(rule="REGEXP", reason=r"'\d' has different meaning outside of python."),
+        )
+
+    @staticmethod
+    def test_when_type_is_NaiveDatetime():
+        class MyDatetime(NaiveDatetime):
+            VALUE_MIN = NaiveDatetime(datetime(2000, 1, 1))  # noqa: DTZ001
+            VALUE_MAX = NaiveDatetime(datetime(2100, 1, 1))  # noqa: DTZ001
+
+        result = export_json_schema(MyDatetime)
+
+        assert result.schema == {"title": "MyDatetime", "type": "string"}
+        assert [inexact.rule for inexact in result.inexact] == ["TIMEZONE", "VALUE_MIN", "VALUE_MAX"]
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime():
+        result = export_json_schema(AwareDatetime)
+
+        assert result.schema == {"title": "AwareDatetime", "type": "string", "format": "date-time"}
+        assert result.inexact == (Inexact(
+            rule="TIMEZONE",
+            reason="JSON Schema 'format' is only an annotation unless format-assertion vocabulary is enabled.",
+        ), )
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime_with_TIMEZONE():
+        result = export_json_schema(UtcDatetime)
+
+        assert result.schema == {"title": "UtcDatetime", "type": "string", "format": "date-time"}
+        assert result.inexact[1] == Inexact(rule="TIMEZONE", reason="JSON Schema cannot restrict datetime offset.")
+
+    @staticmethod
+    def test_when_validate_timezone_is_overridden():
+        result = export_json_schema(NotUtcDatetime)
+
+        assert result.schema == {"title": "NotUtcDatetime", "type": "string"}
+        assert result.inexact == (
+            Inexact(rule="TIMEZONE", reason="Overridden 'validate_timezone' method cannot be exported."),
+            Inexact(rule="VALUE_MAX", reason="JSON Schema cannot compare datetime values."),
+        )
+
+    @staticmethod
+    def test_when_type_cannot_be_exported():
+        class MyType(Type[bytes]):
+            @override
+            @classmethod
+            def validate(cls: type[MyType], value: bytes) -> bytes:
+                return value
+
+        with pytest.raises(TypeError) as exc_info:
+            export_json_schema(MyType)
+
+        assert exc_info.value.args == ("MyType cannot be exported.", )
+
+
+class Test_export_sql_check:  # noqa: N801
+
+    @staticmethod
+    def test_when_type_is_Int():
+        class MyInt(PositiveInt):
+            VALUE_MAX = Int(10)
+
+        result = export_sql_check(MyInt, "foo")
+
+        assert result.check == 'CHECK ("foo" >= 0 AND "foo" <= 10)'
+        assert result.inexact == ()
+
+    @staticmethod
+    def test_when_column_name_has_quotes():
+        result = export_sql_check(PositiveInt, 'foo"; DROP TABLE bar; --')
+
+        assert result.check == 'CHECK ("foo""; DROP TABLE bar; --" >= 0)'
+
+    @staticmethod
+    def test_when_validate_is_overridden():
+        result = export_sql_check(EvenInt, "foo")
+
+        assert result.check == "CHECK (TRUE)"
+        assert [inexact.rule for inexact in result.inexact] == ["VALUE_MIN", "VALUE_MAX"]
+
+    @staticmethod
+    def test_when_type_is_Int_without_rules():
+        result = export_sql_check(Int, "foo")
+
+        assert result.check == "CHECK (TRUE)"
+
+    @staticmethod
+    def test_when_type_is_Str():
+        result = export_sql_check(ProfileName, "foo")
+
+        assert result.check == (
+            'CHECK (char_length("foo") >= 1 AND char_length("foo") <= 50 AND '
+            "\"foo\" ~ '^(?:[A-Za-zА-яЁё''-.() ]*)$')"  # noqa: RUF001
+        )
+        assert result.inexact == ()
+
+    @staticmethod
+    def test_when_type_is_Str_without_rules():
+        result = export_sql_check(Str, "foo")
+
+        assert result.check == 'CHECK (char_length("foo") >= 0)'
+
+    @staticmethod
+    def test_when_rule_is_overridden():
+        result = export_sql_check(LowercaseStr, "foo")
+
+        assert result.check == 'CHECK (char_length("foo") >= 0 AND char_length("foo") <= 10)'
+        assert result.inexact == (
+            Inexact(rule="REGEXP", reason="Overridden 'validate_regexp' method cannot be exported."),
+        )
+
+    @staticmethod
+    def test_when_LENGTH_MIN_rule_is_overridden():
+        result = export_sql_check(StrippedStr, "foo")
+
+        assert result.check == "CHECK (TRUE)"
+        assert [inexact.rule for inexact in result.inexact] == ["LENGTH_MIN"]
+
+    @staticmethod
+    def test_when_REGEXP_has_dot():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a.b")
+
+        result = export_sql_check(MyStr, "foo")
+
+        assert result.check == "CHECK (char_length(\"foo\") >= 0 AND \"foo\" ~ '^(?:a[^\\n]b)$')"
+
+    @staticmethod
+    def test_when_REGEXP_has_dot_with_DOTALL_flag():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a.b{2}", flags=re.DOTALL)
+
+        result = export_sql_check(MyStr, "foo")
+
+        assert result.check == "CHECK (char_length(\"foo\") >= 0 AND \"foo\" ~ '^(?:a.b{2})$')"
+
+    @staticmethod
+    def test_when_REGEXP_has_too_large_repetition_bound():
+        result = export_sql_check(ProfileDescription, "foo")
+
+        assert result.check == 'CHECK (char_length("foo") >= 1 AND char_length("foo") <= 1000)'
+        assert result.inexact == (
+            Inexact(rule="REGEXP", reason="Repetition bound should not be greater than 255."),
+            Inexact(rule="REGEXP", reason="Regular expression is omitted."),
+        )
+
+    @staticmethod
+    def test_when_REGEXP_has_curly_bracket_which_is_not_repetition_bound():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a{b}")
+
+        result = export_sql_check(MyStr, "foo")
+
+        assert result.check == "CHECK (char_length(\"foo\") >= 0 AND \"foo\" ~ '^(?:a{b})$')"
+
+    @staticmethod
+    def test_when_REGEXP_has_repetition_bound_without_minimum():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a{,3}")
+
+        result = export_sql_check(MyStr, "foo")
+
+        assert result.check == "CHECK (char_length(\"foo\") >= 0 AND \"foo\" ~ '^(?:a{0,3})$')"
+
+    @staticmethod
+    def test_when_type_is_NaiveDatetime():
+        class MyDatetime(NaiveDatetime):
+            VALUE_MIN = NaiveDatetime(datetime(2000, 1, 1))  # noqa: DTZ001
+            VALUE_MAX = NaiveDatetime(datetime(2100, 1, 1))  # noqa: DTZ001
+
+        result = export_sql_check(MyDatetime, "foo")
+
+        assert result.check == (
+            "CHECK (\"foo\" >= TIMESTAMP '2000-01-01 00:00:00' AND \"foo\" <= TIMESTAMP '2100-01-01 00:00:00')"
+        )
+        assert result.inexact == (Inexact(rule="TIMEZONE", reason="Timezone can be enforced only by column type."), )
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime():
+        class MyDatetime(AwareDatetime):
+            VALUE_MAX = AwareDatetime(datetime(2100, 1, 1, tzinfo=timezone.utc))
+
+        result = export_sql_check(MyDatetime, "foo")
+
+        assert result.check == "CHECK (\"foo\" <= TIMESTAMP WITH TIME ZONE '2100-01-01 00:00:00+00:00')"
+
+    @staticmethod
+    def test_when_validate_timezone_is_overridden():
+        result = export_sql_check(NotUtcDatetime, "foo")
+
+        assert result.check == "CHECK (\"foo\" <= TIMESTAMP WITH TIME ZONE '2100-01-01 00:00:00+00:00')"
+        assert result.inexact == (
+            Inexact(rule="TIMEZONE", reason="Overridden 'validate_timezone' method cannot be exported."),
+        )
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime_without_rules():
+        result = export_sql_check(UtcDatetime, "foo")
+
+        assert result.check == "CHECK (TRUE)"
+
+    @staticmethod
+    def test_when_type_cannot_be_exported():
+        class MyType(Type[bytes]):
+            @override
+            @classmethod
+            def validate(cls: type[MyType], value: bytes) -> bytes:
+                return value
+
+        with pytest.raises(TypeError) as exc_info:
+            export_sql_check(MyType, "foo")
+
+        assert exc_info.value.args == ("MyType cannot be exported.", )
@@ -0,0 +1,45 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+from wlss.core.latency import _percentile, measure_latency
+from wlss.core.types import Int, PositiveInt
+
+
+class Test_measure_latency:  # noqa: N801
+
+    @staticmethod
+    def test_when_latency_is_within_budget():
+        result = measure_latency([PositiveInt], budget_ns=10 ** 9, repeat=2)
+
+        assert [(latency.type_name, latency.category) for latency in result.latencies] == [
+            ("PositiveInt", "typical"),
+            ("PositiveInt", "boundary"),
+            ("PositiveInt", "adversarial"),
+        ]
+        assert all(0 < latency.p50_ns <= latency.p99_ns <= latency.max_ns for latency in result.latencies)
+        assert result.outliers == ()
+        assert "OUTLIER" not in result.format()
+
+    @staticmethod
+    def test_when_latency_is_over_budget():
+        result = measure_latency([Int], budget_ns=0, repeat=1)
+
+        assert len(result.outliers) == 11
+        assert result.outliers[0].type_name == "Int"
+        assert result.outliers[0].latency_ns > 0
+        lines = result.format().splitlines()
+        assert lines[0].split() == ["type", "category", "p50,", "us", "p99,", "us", "max,", "us"]
+        assert lines[1].startswith("Int                     typical")
+        assert lines[-1].startswith("OUTLIER Int adversarial (integer out of signed 64-bit range): ")
+        assert lines[-1].endswith(" us > 0.0 us")
+
+
+class Test_percentile:  # noqa: N801
+
+    @staticmethod
+    def test_when_percentile_is_calculated():
+        values = list(range(100, 0, -1))
+
+        assert _percentile(values, 50) == 50
+        assert _percentile(values, 99) == 99
+        assert _percentile([42], 99) == 42
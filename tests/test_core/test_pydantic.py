@@ -0,0 +1,363 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pydantic
+import pytest
+from typing_extensions import override
+
+from wlss.account.types import AccountEmail
+from wlss.core.exceptions import ValidationError
+from wlss.core.pydantic import build_core_schema
+from wlss.core.types import AwareDatetime, DatetimeType, Int, NaiveDatetime, PositiveInt, Str, Type
+from wlss.file.types import FileSize
+from wlss.shared.types import Id, UtcDatetime
+
+
+def get_error(adapter: pydantic.TypeAdapter[Any], value: object) -> tuple[str, str]:
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        adapter.validate_python(value)
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    return errors[0]["type"], errors[0]["msg"]
+
+
+def create_type(base: type[Type[Any]], rule: str, rejected: object, **attributes: object) -> type[Type[Any]]:
+    """Create subclass of the base type which overrides the rule to reject only the given value."""
+    def validate_rule(cls: type[Type[Any]], value: object) -> object:
+        if value == rejected:
+            msg = f"{cls.__name__} value is rejected."
+            raise ValidationError(msg)
+        return value
+
+    return type("MyType", (base, ), {**attributes, rule: classmethod(validate_rule)})
+
+
+class Test_build_core_schema:  # noqa: N801
+
+    @staticmethod
+    def test_when_type_is_Int():
+        class MyInt(Int):
+            VALUE_MIN = Int(0)
+            VALUE_MAX = Int(10)
+
+        adapter: pydantic.TypeAdapter[MyInt] = pydantic.TypeAdapter(MyInt)
+
+        result = adapter.validate_python(5)
+
+        assert type(result) is MyInt
+        assert result.value == 5
+        assert get_error(adapter, 11) == ("less_than_equal", "Input should be less than or equal to 10")
+        assert get_error(adapter, -1) == ("greater_than_equal", "Input should be greater than or equal to 0")
+
+    @staticmethod
+    def test_when_type_is_Int_without_rules():
+        adapter: pydantic.TypeAdapter[Int] = pydantic.TypeAdapter(Int)
+
+        result = adapter.validate_json("42")
+
+        assert result == Int(42)
+
+    @staticmethod
+    def test_when_Int_has_custom_validation():
+        class EvenInt(Int):
+            @override
+            @classmethod
+            def validate(cls: type[EvenInt], value: int) -> int:
+                if value % 2:
+                    msg = f"{cls.__name__} value should be even."
+                    raise ValidationError(msg)
+                return value
+
+        adapter: pydantic.TypeAdapter[EvenInt] = pydantic.TypeAdapter(EvenInt)
+
+        assert adapter.validate_python(2) == EvenInt(2)
+        assert get_error(adapter, 3) == ("value_error", "Value error, EvenInt value should be even.")
+
+    @staticmethod
+    @pytest.mark.parametrize(("rule", "accepted", "rejected"), [
+        ("validate_value_max", 11, 5),
+        ("validate_value_min", -1, 5),
+    ])
+    def test_when_Int_rule_is_overridden(rule, accepted, rejected):
+        type_ = create_type(Int, rule, rejected, VALUE_MIN=Int(0), VALUE_MAX=Int(10))
+
+        adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(type_)
+
+        assert adapter.validate_python(accepted).value == accepted
+        assert get_error(adapter, rejected) == ("value_error", "Value error, MyType value is rejected.")
+
+    @staticmethod
+    def test_when_type_is_Str():
+        class MyStr(Str):
+            LENGTH_MIN = PositiveInt(2)
+            LENGTH_MAX = PositiveInt(4)
+            REGEXP = re.compile(r"[a-z]+")
+
+        adapter: pydantic.TypeAdapter[MyStr] = pydantic.TypeAdapter(MyStr)
+
+        assert adapter.validate_python("foo") == MyStr("foo")
+        assert get_error(adapter, "f") == ("string_too_short", "String should have at least 2 characters")
+        assert get_error(adapter, "fooba") == ("string_too_long", "String should have at most 4 characters")
+        assert get_error(adapter, "Foo") == (
+            "string_pattern_mismatch",
+            "String should match pattern '^(?:[a-z]+)$'",
+        )
+
+    @staticmethod
+    def test_when_type_is_Str_without_rules():
+        adapter: pydantic.TypeAdapter[Str] = pydantic.TypeAdapter(Str)
+
+        assert adapter.validate_python("") == Str("")
+
+    @staticmethod
+    def test_when_REGEXP_has_DOTALL_flag():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a.b", flags=re.DOTALL)
+
+        adapter: pydantic.TypeAdapter[MyStr] = pydantic.TypeAdapter(MyStr)
+
+        assert adapter.validate_python("a\nb") == MyStr("a\nb")
+        assert get_error(adapter, "a\nbc")[0] == "string_pattern_mismatch"
+
+    @staticmethod
+    def test_when_REGEXP_has_dot_without_DOTALL_flag():
+        class MyStr(Str):
+            REGEXP = re.compile(r"a.b")
+
+        adapter: pydantic.TypeAdapter[MyStr] = pydantic.TypeAdapter(MyStr)
+
+        assert get_error(adapter, "a\nb")[0] == "string_pattern_mismatch"
+
+    @staticmethod
+    @pytest.mark.parametrize("regexp", [
+        re.compile(r"a$"),
+        re.compile(r"a~~b"),
+        re.compile(r"a", flags=re.IGNORECASE),
+        re.compile(r"(?<=a)b"),
+    ])
+    def test_when_REGEXP_cannot_be_translated(regexp):
+        class MyStr(Str):
+            REGEXP = regexp
+            LENGTH_MAX = PositiveInt(10)
+
+        adapter: pydantic.TypeAdapter[MyStr] = pydantic.TypeAdapter(MyStr)
+
+        assert get_error(adapter, "c") == (
+            "value_error",
+            f"Value error, MyStr value should match regular expression: {regexp.pattern}",
+        )
+        assert get_error(adapter, "c" * 11)[0] == "string_too_long"
+
+    @staticmethod
+    @pytest.mark.parametrize(("rule", "accepted", "rejected"), [
+        ("validate_length_max", "abcde", "abc"),
+        ("validate_length_min", "a", "abc"),
+        ("validate_regexp", "ABC", "abc"),
+    ])
+    def test_when_Str_rule_is_overridden(rule, accepted, rejected):
+        type_ = create_type(
+            Str, rule, rejected, LENGTH_MIN=PositiveInt(2), LENGTH_MAX=PositiveInt(4), REGEXP=re.compile(r"[a-z]+"),
+        )
+
+        adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(type_)
+
+        assert adapter.validate_python(accepted).value == accepted
+        assert get_error(adapter, rejected) == ("value_error", "Value error, MyType value is rejected.")
+
+    @staticmethod
+    def test_when_Str_has_custom_validation():
+        class MyStr(Str):
+            @override
+            @classmethod
+            def validate(cls: type[MyStr], value: str) -> str:
+                return value.strip()
+
+        adapter: pydantic.TypeAdapter[MyStr] = pydantic.TypeAdapter(MyStr)
+
+        assert adapter.validate_python(" foo ").value == "foo"
+
+    @staticmethod
+    def test_when_type_is_NaiveDatetime():
+        class MyDatetime(NaiveDatetime):
+            VALUE_MIN = NaiveDatetime(datetime(2000, 1, 1))  # noqa: DTZ001
+            VALUE_MAX = NaiveDatetime(datetime(2100, 1, 1))  # noqa: DTZ001
+
+        adapter: pydantic.TypeAdapter[MyDatetime] = pydantic.TypeAdapter(MyDatetime)
+
+        assert adapter.validate_python(datetime(2024, 1, 1)) == MyDatetime(datetime(2024, 1, 1))  # noqa: DTZ001
+        assert get_error(adapter, datetime(1999, 1, 1))[0] == "greater_than_equal"  # noqa: DTZ001
+        assert get_error(adapter, datetime(2101, 1, 1))[0] == "less_than_equal"  # noqa: DTZ001
+        assert get_error(adapter, datetime(2024, 1, 1, tzinfo=timezone.utc))[0] == "timezone_naive"
+
+    @staticmethod
+    @pytest.mark.parametrize(("rule", "accepted", "rejected"), [
+        ("validate_value_max", datetime(2101, 1, 1), datetime(2024, 1, 1)),  # noqa: DTZ001
+        ("validate_value_min", datetime(1999, 1, 1), datetime(2024, 1, 1)),  # noqa: DTZ001
+    ])
+    def test_when_datetime_rule_is_overridden(rule, accepted, rejected):
+        type_ = create_type(
+            NaiveDatetime,
+            rule,
+            rejected,
+            VALUE_MIN=NaiveDatetime(datetime(2000, 1, 1)),  # noqa: DTZ001
+            VALUE_MAX=NaiveDatetime(datetime(2100, 1, 1)),  # noqa: DTZ001
+        )
+
+        adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(type_)
+
+        assert adapter.validate_python(accepted).value == accepted
+        assert get_error(adapter, rejected) == ("value_error", "Value error, MyType value is rejected.")
+
+    @staticmethod
+    def test_when_type_is_AwareDatetime():
+        adapter: pydantic.TypeAdapter[AwareDatetime] = pydantic.TypeAdapter(AwareDatetime)
+
+        assert adapter.validate_json('"2024-01-01T00:00:00+03:00"').value.utcoffset() == timedelta(hours=3)
+        assert get_error(adapter, datetime(2024, 1, 1))[0] == "timezone_aware"  # noqa: DTZ001
+
+    @staticmethod
+    def test_when_AwareDatetime_has_TIMEZONE():
+        class MyDatetime(AwareDatetime):
+            TIMEZONE = timezone.utc
+
+        adapter: pydantic.TypeAdapter[MyDatetime] = pydantic.TypeAdapter(MyDatetime)
+
+        assert adapter.validate_json('"2024-01-01T00:00:00Z"').value.tzinfo == timezone.utc
+        assert get_error(adapter, datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=3)))) == (
+            "value_error",
+            "Value error, MyDatetime value should be timezone-aware datetime in UTC timezone.",
+        )
+
+    @staticmethod
+    def test_when_datetime_type_has_custom_timezone_validation():
+        class MyDatetime(DatetimeType):
+            @override
+            @classmethod
+            def validate_timezone(cls: type[MyDatetime], value: datetime) -> datetime:
+                return value.replace(tzinfo=None)
+
+        adapter: pydantic.TypeAdapter[MyDatetime] = pydantic.TypeAdapter(MyDatetime)
+
+        result = adapter.validate_python(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        assert result.value == datetime(2024, 1, 1)  # noqa: DTZ001
+
+    @staticmethod
+    def test_when_datetime_type_has_custom_validation():
+        class MyDatetime(NaiveDatetime):
+            @override
+            @classmethod
+            def validate(cls: type[MyDatetime], value: datetime) -> datetime:
+                return value.replace(microsecond=0)
+
+        adapter: pydantic.TypeAdapter[MyDatetime] = pydantic.TypeAdapter(MyDatetime)
+
+        result = adapter.validate_python(datetime(2024, 1, 1, microsecond=42))  # noqa: DTZ001
+
+        assert result.value == datetime(2024, 1, 1)  # noqa: DTZ001
+
+    @staticmethod
+    def test_when_value_is_object_of_the_type():
+        value = Int(42)
+
+        adapter: pydantic.TypeAdapter[Int] = pydantic.TypeAdapter(Int)
+
+        assert adapter.validate_python(value) is value
+
+    @staticmethod
+    def test_when_value_is_object_of_subclass_with_looser_rules():
+        class WideInt(PositiveInt):
+            VALUE_MIN = Int(-5)
+
+        adapter: pydantic.TypeAdapter[PositiveInt] = pydantic.TypeAdapter(PositiveInt)
+
+        result = adapter.validate_python(WideInt(5))
+
+        assert type(result) is PositiveInt
+        assert result.value == 5
+        assert get_error(adapter, WideInt(-3)) == ("greater_than_equal", "Input should be greater than or equal to 0")
+
+    @staticmethod
+    def test_when_value_is_object_of_another_type():
+        adapter: pydantic.TypeAdapter[Id] = pydantic.TypeAdapter(Id)
+
+        assert adapter.validate_python(Int(5)) == Id(5)
+        assert adapter.validate_python(FileSize(5)) == Id(5)
+        assert get_error(adapter, Int(-1)) == ("greater_than_equal", "Input should be greater than or equal to 0")
+
+    @staticmethod
+    @pytest.mark.parametrize(("type_", "value", "error_type"), [
+        (AccountEmail, b"a@b.c", "string_type"),
+        (Id, "42", "int_type"),
+        (Id, True, "int_type"),
+        (Id, 4.0, "int_type"),
+        (UtcDatetime, 1_700_000_000, "datetime_type"),
+        (UtcDatetime, "2024-01-01T00:00:00Z", "datetime_type"),
+    ])
+    def test_when_value_would_be_coerced_in_lax_mode(type_, value, error_type):
+        adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(type_)
+
+        assert get_error(adapter, value)[0] == error_type
+
+    @staticmethod
+    def test_when_datetime_is_validated_from_json():
+        adapter: pydantic.TypeAdapter[UtcDatetime] = pydantic.TypeAdapter(UtcDatetime)
+
+        result = adapter.validate_json('"2024-01-01T00:00:00Z"')
+
+        assert result == UtcDatetime(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        with pytest.raises(pydantic.ValidationError):
+            adapter.validate_json("1700000000")
+
+    @staticmethod
+    def test_when_value_is_lazy_object_of_the_type():
+        valid = PositiveInt.lazy(42)
+        invalid = PositiveInt.lazy(-5)
+
+        adapter: pydantic.TypeAdapter[PositiveInt] = pydantic.TypeAdapter(PositiveInt)
+
+        assert adapter.validate_python(valid) is valid
+        assert PositiveInt.lazy_stats().forced >= 1
+        assert get_error(adapter, invalid) == (
+            "value_error",
+            "Value error, PositiveInt value should not be less than 0.",
+        )
+
+    @staticmethod
+    def test_when_model_is_validated_from_dict():
+        class Model(pydantic.BaseModel):
+            foo: PositiveInt
+
+        with pytest.raises(pydantic.ValidationError) as exc_info:
+            Model.model_validate({"foo": -1})
+
+        assert [(error["loc"], error["type"]) for error in exc_info.value.errors()] == [
+            (("foo", ), "greater_than_equal"),
+        ]
+
+    @staticmethod
+    def test_when_value_is_serialized():
+        class Model(pydantic.BaseModel):
+            foo: Int
+
+        model = Model.model_validate({"foo": 42})
+
+        assert model.model_dump() == {"foo": Int(42)}
+        assert model.model_dump_json() == '{"foo":42}'
+
+    @staticmethod
+    def test_when_type_cannot_be_used_with_pydantic():
+        class MyType(Type[bytes]):
+            @override
+            @classmethod
+            def validate(cls: type[MyType], value: bytes) -> bytes:
+                return value
+
+        with pytest.raises(TypeError) as exc_info:
+            build_core_schema(MyType)
+
+        assert exc_info.value.args == ("MyType cannot be used with pydantic.", )
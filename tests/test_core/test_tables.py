@@ -0,0 +1,199 @@
+# mypy: disable-error-code="no-untyped-def"
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+
+import pytest
+
+from wlss.core.arrays import ITEM_MAX
+from wlss.core.exceptions import ValidationError
+from wlss.core.tables import IntTable, StrTable
+from wlss.core.types import Int, PositiveInt, Str
+
+
+class MyInt(PositiveInt):
+    VALUE_MAX = Int(100)
+
+
+class MyIntTable(IntTable[MyInt]):
+    TYPE = MyInt
+
+
+class PlainIntTable(IntTable[Int]):
+    TYPE = Int
+
+
+class MyStr(Str):
+    REGEXP = re.compile(r"[a-zа-я]+")  # noqa: RUF001
+
+
+class MyStrTable(StrTable[MyStr]):
+    TYPE = MyStr
+
+
+def count_items(path: str, values: list[object], queue: multiprocessing.Queue[int]) -> None:
+    with MyStrTable.open(path) as table:
+        queue.put(sum(value in table for value in values))
+
+
+class Test_Table:  # noqa: N801
+
+    @staticmethod
+    def test_when_table_of_integers_is_built(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [3, MyInt(1), Int(2), 3])
+
+        with MyIntTable.open(path) as table:
+            assert len(table) == 3
+            assert sorted(item.value for item in table) == [1, 2, 3]
+            assert type(next(iter(table))) is MyInt
+
+    @staticmethod
+    def test_when_table_of_strings_is_built(tmp_path):
+        path = tmp_path / "table"
+        MyStrTable.build(path, ["foo", "бар", MyStr("baz")])  # noqa: RUF001
+
+        with MyStrTable.open(path) as table:
+            assert len(table) == 3
+            assert sorted(item.value for item in table) == ["baz", "foo", "бар"]  # noqa: RUF001
+
+    @staticmethod
+    def test_when_table_is_empty(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [])
+
+        with MyIntTable.open(path) as table:
+            assert len(table) == 0
+            assert list(table) == []
+            assert 1 not in table
+
+    @staticmethod
+    def test_when_value_is_invalid(tmp_path):
+        path = tmp_path / "table"
+
+        with pytest.raises(ValidationError) as exc_info:
+            MyIntTable.build(path, [1, 101])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == ("MyInt value should not be greater than 100.", )
+        assert not path.exists()
+
+    @staticmethod
+    def test_when_value_does_not_fit_machine_integer(tmp_path):
+        with pytest.raises(ValidationError) as exc_info:
+            PlainIntTable.build(tmp_path / "table", [ITEM_MAX + 1])
+
+        assert exc_info.type is ValidationError
+        assert exc_info.value.args == (
+            "PlainIntTable value should be in range [-9223372036854775808, 9223372036854775807].",
+        )
+
+    @staticmethod
+    def test_when_values_are_looked_up(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, range(0, 100, 3))
+
+        with MyIntTable.open(path) as table:
+            assert 3 in table
+            assert MyInt(99) in table
+            assert 4 not in table
+            assert ITEM_MAX + 1 not in table
+            assert Int(3) not in table
+            assert "3" not in table
+            result = table.get(42)
+            assert type(result) is MyInt
+            assert result == MyInt(42)
+            assert table.get(43) is None
+
+    @staticmethod
+    def test_when_strings_are_looked_up(tmp_path):
+        path = tmp_path / "table"
+        MyStrTable.build(path, ["foo", "бар"])  # noqa: RUF001
+
+        with MyStrTable.open(path) as table:
+            assert "бар" in table  # noqa: RUF001
+            assert MyStr("foo") in table
+            assert "fo" not in table
+            assert "\ud800" not in table
+            assert 42 not in table
+
+    @staticmethod
+    def test_when_table_is_built_temporary_file_is_removed(tmp_path):
+        MyIntTable.build(tmp_path / "table", [1])
+
+        assert [path.name for path in tmp_path.iterdir()] == ["table"]
+
+    @staticmethod
+    @pytest.mark.parametrize(("umask", "mode"), [(0o022, 0o644), (0o077, 0o600)])
+    def test_when_table_is_built_file_mode_respects_umask(tmp_path, umask, mode):
+        previous_umask = os.umask(umask)
+        try:
+            MyIntTable.build(tmp_path / "table", [1])
+        finally:
+            os.umask(previous_umask)
+
+        assert (tmp_path / "table").stat().st_mode & 0o777 == mode
+
+    @staticmethod
+    def test_when_table_cannot_be_written(tmp_path, monkeypatch):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [1])
+
+        def fsync(fd: int) -> None:
+            raise OSError
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        with pytest.raises(OSError):  # noqa: PT011
+            MyIntTable.build(path, [2])
+
+        assert [path.name for path in tmp_path.iterdir()] == ["table"]
+        with MyIntTable.open(path) as table:
+            assert 1 in table
+
+    @staticmethod
+    def test_when_table_is_rebuilt(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [1])
+
+        with MyIntTable.open(path) as table:
+            MyIntTable.build(path, [2])
+
+            assert 1 in table
+            with MyIntTable.open(path) as new_table:
+                assert 1 not in new_table
+                assert 2 in new_table
+
+    @staticmethod
+    def test_when_file_is_not_a_table_of_the_type(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [1])
+
+        with pytest.raises(ValueError, match="is not a table of tests.test_core.test_tables.MyStr."):
+            MyStrTable.open(path)
+
+        path.write_bytes(b"foo")
+        with pytest.raises(ValueError, match="is not a table of tests.test_core.test_tables.MyInt."):
+            MyIntTable.open(path)
+
+    @staticmethod
+    def test_when_table_is_shared_with_child_processes(tmp_path):
+        path = str(tmp_path / "table")
+        MyStrTable.build(path, ["foo", "bar"])
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+
+        process = context.Process(target=count_items, args=(path, ["foo", "bar", "baz"], queue))
+        process.start()
+        process.join()
+
+        assert queue.get() == 2
+
+    @staticmethod
+    def test_when_table_is_represented(tmp_path):
+        path = tmp_path / "table"
+        MyIntTable.build(path, [1])
+
+        with MyIntTable.open(path) as table:
+            assert repr(table) == f"MyIntTable.open({str(path)!r})"
@@ -1,18 +1,167 @@
 # mypy: disable-error-code="no-untyped-def"
 from __future__ import annotations
 
+import gc
 import re
 import subprocess
 import sys
 import textwrap
+import threading
+import weakref
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from typing_extensions import override
 
 from wlss.core.exceptions import ValidationError
 from wlss.core.types import AwareDatetime, Int, NaiveDatetime, PositiveInt, Str
 
 
+class Test_Type_lazy:  # noqa: N801
+
+    @staticmethod
+    def test_when_lazy_object_is_created():
+        class MyInt(Int):
+            VALUE_MIN = Int(0)
+
+        result = MyInt.lazy(-42)
+
+        assert isinstance(result, MyInt)
+        assert MyInt.lazy_stats() == (1, 0)
+        assert MyInt.lazy_stats().unforced == 1
+
+    @staticmethod
+    def test_when_lazy_object_value_is_accessed():
+        class MyInt(Int):
+            ...
+
+        result = MyInt.lazy(Int(42))
+
+        assert result.value == 42
+        assert result.value == 42
+        assert MyInt.lazy_stats() == (1, 1)
+
+    @staticmethod
+    def test_when_lazy_object_is_compared_and_hashed():
+        class MyStr(Str):
+            ...
+
+        foo = MyStr.lazy("foo")
+        bar = MyStr.lazy("foo")
+
+        assert foo == MyStr("foo")
+        assert hash(bar) == hash("foo")
+        assert MyStr.lazy_stats() == (2, 2)
+
+    @staticmethod
+    def test_when_lazy_object_is_forced():
+        class MyInt(Int):
+            ...
+
+        result = MyInt.lazy(42)
+
+        assert result.force() is result
+        assert result.force() is result
+        assert MyInt.lazy_stats() == (1, 1)
+
+    @staticmethod
+    def test_when_regular_object_is_forced():
+        class MyInt(Int):
+            ...
+
+        result = MyInt(42)
+
+        assert result.force() is result
+        assert MyInt.lazy_stats() == (0, 0)
+
+    @staticmethod
+    def test_when_lazy_object_has_invalid_value():
+        class MyInt(Int):
+            VALUE_MIN = Int(0)
+
+        result = MyInt.lazy(-42)
+
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                result.force()
+
+            assert exc_info.type is ValidationError
+            assert exc_info.value.args == ("MyInt value should not be less than 0.", )
+        assert MyInt.lazy_stats() == (1, 0)
+
+    @staticmethod
+    def test_when_lazy_object_is_forced_concurrently():
+        class MyInt(Int):
+            @override
+            @classmethod
+            def validate(cls: type[MyInt], value: int) -> int:
+                # force the same object while it's being forced, as another thread would do
+                calls.append(value)
+                if len(calls) == 1:
+                    result.force()
+                return value
+
+        calls: list[int] = []
+        result = MyInt.lazy(42)
+
+        assert result.force() is result
+        assert result.value == 42
+        assert calls == [42, 42]
+        assert MyInt.lazy_stats() == (1, 1)
+
+    @staticmethod
+    def test_when_lazy_objects_are_created_and_forced_by_threads():
+        class MyInt(Int):
+            ...
+
+        def create_and_force() -> None:
+            for value in range(10_000):
+                MyInt.lazy(value).force()
+
+        # frequent switching of threads makes lost updates of counters likely
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=create_and_force) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert MyInt.lazy_stats() == (80_000, 80_000)
+
+    @staticmethod
+    def test_when_raw_value_has_been_removed_by_another_thread():
+        result = Int.lazy(42)
+        del result._raw  # noqa: SLF001
+
+        assert result.force() is result
+
+    @staticmethod
+    def test_when_type_with_lazy_stats_is_garbage_collected():
+        class MyInt(Int):
+            ...
+
+        MyInt.lazy(42)
+        type_ref = weakref.ref(MyInt)
+        del MyInt
+        gc.collect()
+
+        assert type_ref() is None
+
+    @staticmethod
+    def test_when_lazy_stats_are_reset():
+        class MyInt(Int):
+            ...
+
+        MyInt.lazy(42).force()
+        MyInt.reset_lazy_stats()
+
+        assert MyInt.lazy_stats() == (0, 0)
+
+
 class Test_Int:  # noqa: N801
 
     @staticmethod
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from wlss.file.tables import FileNameTable  # noqa: F401
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from wlss.shared.arrays import IdArray  # noqa: F401
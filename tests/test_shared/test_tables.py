@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from wlss.shared.tables import IdTable  # noqa: F401
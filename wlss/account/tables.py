@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from wlss.account.types import AccountLogin
+from wlss.core.tables import StrTable
+
+
+class AccountLoginTable(StrTable[AccountLogin]):
+    TYPE = AccountLogin
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Generic, overload, TYPE_CHECKING, TypeVar
+
+from typing_extensions import override
+
+from wlss.core.exceptions import ValidationError
+from wlss.core.types import Int, Type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Self
+
+
+# items are stored as signed 64-bit machine integers
+TYPECODE = "q"
+ITEM_MAX = 2 ** 63 - 1
+ITEM_MIN = -(2 ** 63)
+
+
+IntT = TypeVar("IntT", bound=Int)
+
+
+class IntArray(Generic[IntT]):
+    """Compact collection of validated integers.
+
+    Items are validated in bulk and stored as raw machine integers,
+    objects of TYPE are created only when items are accessed.
+    """
+
+    TYPE: type[IntT]
+
+    def __init__(self: Self, values: Iterable[int | Int] = ()) -> None:
+        self._data = array(TYPECODE)
+        # sorted copy of items used for membership tests, it's built on demand
+        self._index: array[int] | None = None
+        self.extend(values)
+
+    @classmethod
+    def _from_validated(cls: type[Self], data: array[int]) -> Self:
+        obj = cls()
+        obj._data = data  # noqa: SLF001
+        return obj
+
+    def append(self: Self, value: int | Int) -> None:
+        self.extend((value, ))
+
+    def extend(self: Self, values: Iterable[int | Int]) -> None:
+        # subclass of TYPE may loosen its rules, so only items of exactly the same type are not validated again
+        if isinstance(values, IntArray) and values.TYPE is self.TYPE:
+            data = values._data  # noqa: SLF001
+        else:
+            data = self._validate([value.value if isinstance(value, Type) else value for value in values])
+        self._data.extend(data)
+        self._index = None
+
+    def _validate(self: Self, values: list[int]) -> array[int]:
+        if not values:
+            return array(TYPECODE)
+        if self._has_range_rules():
+            # rules of Int define a range of values, so it's enough to validate the smallest and the largest items
+            value_min, value_max = min(values), max(values)
+            is_valid = value_min >= ITEM_MIN and value_max <= ITEM_MAX and self._is_valid(value_min, value_max)
+        else:
+            is_valid = False
+        if not is_valid:
+            # validate items one by one to report an error for the first invalid item,
+            # items are stored as returned by validation, so they can be accessed without validating them again
+            validated = []
+            for value in values:
+                item = self.TYPE(value).value
+                if not ITEM_MIN <= item <= ITEM_MAX:
+                    msg = f"{self.__class__.__name__} value should be in range [{ITEM_MIN}, {ITEM_MAX}]."
+                    raise ValidationError(msg)
+                validated.append(item)
+            values = validated
+        return array(TYPECODE, values)
+
+    def _has_range_rules(self: Self) -> bool:
+        """Return True if TYPE validates values exactly as Int does, i.e. none of its rules is overridden."""
+        return all(
+            getattr(self.TYPE, method).__func__ is getattr(Int, method).__func__
+            for method in ("validate", "validate_value_max", "validate_value_min")
+        )
+
+    def _is_valid(self: Self, *values: int) -> bool:
+        try:
+            for value in values:
+                self.TYPE.validate(value)
+        except ValidationError:
+            return False
+        return True
+
+    def tolist(self: Self) -> list[int]:
+        return self._data.tolist()
+
+    def intersection(self: Self, other: IntArray[Any]) -> Self:
+        """Return sorted array of unique items which are present in both arrays."""
+        return self._from_validated(array(TYPECODE, sorted(set(self._data).intersection(other._data))))  # noqa: SLF001
+
+    def union(self: Self, other: IntArray[Any]) -> Self:
+        """Return sorted array of unique items which are present in any of arrays."""
+        result = self.__class__(other)
+        return self._from_validated(array(TYPECODE, sorted(set(self._data).union(result._data))))  # noqa: SLF001
+
+    def difference(self: Self, other: IntArray[Any]) -> Self:
+        """Return sorted array of unique items which are present in this array but not in the other one."""
+        return self._from_validated(array(TYPECODE, sorted(set(self._data).difference(other._data))))  # noqa: SLF001
+
+    def __and__(self: Self, other: IntArray[Any]) -> Self:
+        return self.intersection(other)
+
+    def __or__(self: Self, other: IntArray[Any]) -> Self:
+        return self.union(other)
+
+    def __sub__(self: Self, other: IntArray[Any]) -> Self:
+        return self.difference(other)
+
+    def __contains__(self: Self, value: object) -> bool:
+        if isinstance(value, Type):
+            if not isinstance(value, self.TYPE):
+                return False
+            value = value.value
+        if not isinstance(value, int):
+            return False
+        if self._index is None:
+            self._index = array(TYPECODE, sorted(self._data))
+        position = bisect_left(self._index, value)
+        return position < len(self._index) and self._index[position] == value
+
+    def __len__(self: Self) -> int:
+        return len(self._data)
+
+    def __iter__(self: Self) -> Iterator[IntT]:
+        # items have been validated when they were added to the array
+        return map(self.TYPE._from_validated, self._data)  # noqa: SLF001
+
+    @overload
+    def __getitem__(self: Self, key: int) -> IntT:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self: Self, key: slice) -> Self:
+        ...  # pragma: no cover
+
+    def __getitem__(self: Self, key: int | slice) -> IntT | Self:
+        if isinstance(key, slice):
+            return self._from_validated(self._data[key])
+        return self.TYPE._from_validated(self._data[key])  # noqa: SLF001
+
+    @override
+    def __eq__(self: Self, other: object) -> bool:
+        if isinstance(other, self.__class__):
+            return other._data == self._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self: Self) -> str:
+        return f"{self.__class__.__name__}({self.tolist()})"
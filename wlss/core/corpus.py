@@ -0,0 +1,216 @@
+"""Generation of inputs which exercise validation rules of types.
+
+Corpus of a type consists of samples of three categories:
+
+    typical     random valid values
+    boundary    values on both sides of every limit of the type
+    adversarial values which are expensive to validate, e.g. long near-miss inputs for regular expressions
+
+Corpus is deterministic, the same seed always produces the same samples.
+"""
+from __future__ import annotations
+
+import random
+import re
+import string
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal, TYPE_CHECKING
+
+from wlss.core.exceptions import ValidationError
+from wlss.core.types import DatetimeType, Int, Str
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import tzinfo
+
+    from wlss.core.types import Type
+
+
+Category = Literal["typical", "boundary", "adversarial"]
+
+# number of typical samples generated for every type
+TYPICAL_SIZE = 8
+# typical strings are rarely long, it keeps typical samples apart from boundary ones
+TYPICAL_LENGTH_MAX = 32
+# number of attempts to generate a valid typical sample
+TYPICAL_ATTEMPTS = 100
+# limits used to generate values of types which don't have their own limits
+INT_MIN = -(10 ** 6)
+INT_MAX = 10 ** 6
+DATETIME_MIN = datetime(2000, 1, 1, tzinfo=timezone.utc)
+DATETIME_MAX = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+_CYRILLIC = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+_CHARACTERS = string.ascii_letters + string.digits + string.punctuation + " " + _CYRILLIC
+# characters which are rejected by most regular expressions (e.g. "." doesn't match new line)
+_REJECTED_CHARACTERS = "\n\0"
+_ASTRAL_CHARACTER = "\U0001F600"
+_REGEXP_SPECIAL_CHARACTERS = ".^$*+?()|"
+# escaped character, character class ("]" right after "[" or "[^" belongs to the class), repetition bound or character
+_REGEXP_TOKEN = re.compile(r"\\.|\[\^?\]?(?:\\.|[^\]])*\]|\{\d*(?:,\d*)?\}|.", flags=re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Sample:
+    category: Category
+    description: str
+    value: Any
+
+
+def generate_corpus(type_: type[Type[Any]], seed: int = 0) -> tuple[Sample, ...]:
+    """Generate typical, boundary and adversarial samples for the type according to its rules."""
+    generator = random.Random(f"{seed}:{type_.__module__}.{type_.__qualname__}")
+    if issubclass(type_, Int):
+        return _generate_int_corpus(type_, generator)
+    if issubclass(type_, Str):
+        return _generate_str_corpus(type_, generator)
+    if issubclass(type_, DatetimeType):
+        return _generate_datetime_corpus(type_, generator)
+    msg = f"{type_.__name__} cannot be used to generate corpus."
+    raise TypeError(msg)
+
+
+def _is_valid(type_: type[Type[Any]], value: object) -> bool:
+    try:
+        type_.validate(value)
+    except ValidationError:
+        return False
+    return True
+
+
+def _generate_typical(
+    type_: type[Type[Any]],
+    generator: random.Random,
+    factory: Callable[[random.Random], object],
+) -> list[Sample]:
+    samples = []
+    for _ in range(TYPICAL_ATTEMPTS):
+        value = factory(generator)
+        if _is_valid(type_, value):
+            samples.append(Sample("typical", "random valid value", value))
+        if len(samples) == TYPICAL_SIZE:
+            break
+    return samples
+
+
+def _generate_int_corpus(type_: type[Int], generator: random.Random) -> tuple[Sample, ...]:
+    value_min = type_.VALUE_MIN.value if type_.VALUE_MIN is not None else INT_MIN
+    value_max = type_.VALUE_MAX.value if type_.VALUE_MAX is not None else INT_MAX
+    samples = _generate_typical(type_, generator, lambda generator: generator.randint(value_min, value_max))
+    for name, limit in [("VALUE_MIN", type_.VALUE_MIN), ("VALUE_MAX", type_.VALUE_MAX)]:
+        if limit is not None:
+            samples.extend(
+                Sample("boundary", f"{name} {offset:+}", limit.value + offset) for offset in (-1, 0, 1)
+            )
+    samples.extend([
+        Sample("adversarial", "huge positive integer", 10 ** 4000),
+        Sample("adversarial", "huge negative integer", -(10 ** 4000)),
+        Sample("adversarial", "integer out of signed 64-bit range", 2 ** 63),
+    ])
+    return tuple(samples)
+
+
+def _generate_str_corpus(type_: type[Str], generator: random.Random) -> tuple[Sample, ...]:
+    length_min = type_.LENGTH_MIN.value
+    # long samples of types without LENGTH_MAX are based on the longest typical sample
+    length_max = type_.LENGTH_MAX.value if type_.LENGTH_MAX is not None else max(length_min, TYPICAL_LENGTH_MAX)
+    alphabet = [character for character in _CHARACTERS if _matches(type_.REGEXP, character)]
+    literals = _extract_literals(type_.REGEXP) if type_.REGEXP is not None else []
+    filler = alphabet[0] if alphabet else "a"
+
+    def create_typical(generator: random.Random) -> str:
+        length = generator.randint(length_min, max(length_min, min(length_max, TYPICAL_LENGTH_MAX)))
+        if alphabet:
+            return "".join(generator.choices(alphabet, k=length))
+        # regular expression describes a structure (e.g. email), so its literals separate random words
+        words = ["".join(generator.choices(string.ascii_lowercase, k=generator.randint(1, 8))) for _ in literals]
+        return "".join(word + literal for word, literal in zip(words, literals)) + "".join(
+            generator.choices(string.ascii_lowercase, k=generator.randint(1, 8)),
+        )
+
+    samples = _generate_typical(type_, generator, create_typical)
+    lengths = {max(length_min - 1, 0), length_min}
+    if type_.LENGTH_MAX is not None:
+        lengths.update({length_max, length_max + 1})
+    samples.extend(Sample("boundary", f"length {length}", filler * length) for length in sorted(lengths))
+
+    samples.extend([
+        Sample("adversarial", f"length {length_max * 100}", filler * length_max * 100),
+        Sample("adversarial", "multi-byte cyrillic characters", "".join(generator.choices(_CYRILLIC, k=length_max))),
+        Sample("adversarial", "astral plane characters", _ASTRAL_CHARACTER * length_max),
+    ])
+    # character is used for near misses only if regular expression actually rejects it (e.g. without re.DOTALL)
+    near_misses = {rejected: filler * (length_max - 1) + rejected for rejected in _REJECTED_CHARACTERS}
+    rejected_characters = [rejected for rejected, value in near_misses.items() if not _matches(type_.REGEXP, value)]
+    samples.extend(
+        Sample("adversarial", f"near miss, ends with {rejected!r}", near_misses[rejected])
+        for rejected in rejected_characters
+    )
+    for literal in dict.fromkeys(literals):
+        # repeated literal makes backtracking regular expressions try every split of the value
+        pump = (filler + literal) * (length_max // (len(filler) + len(literal)))
+        samples.append(Sample("adversarial", f"near miss, repeated {literal!r}", pump))
+        samples.extend(
+            Sample("adversarial", f"near miss, repeated {literal!r} ends with {rejected!r}", pump[:-1] + rejected)
+            for rejected in rejected_characters[:1]
+        )
+    return tuple(samples)
+
+
+def _matches(regexp: re.Pattern[str] | None, value: str) -> bool:
+    return regexp is None or regexp.fullmatch(value) is not None
+
+
+def _extract_literals(regexp: re.Pattern[str]) -> list[str]:
+    """Return characters which regular expression matches literally outside of character classes."""
+    literals = []
+    for token in _REGEXP_TOKEN.findall(regexp.pattern):
+        if token.startswith("\\"):
+            if not token[1:].isalnum():
+                literals.append(token[1:])
+        # longer tokens are character classes and repetition bounds, they don't match characters literally
+        elif len(token) == 1 and token not in _REGEXP_SPECIAL_CHARACTERS:
+            literals.append(token)
+    return literals
+
+
+def _generate_datetime_corpus(type_: type[DatetimeType], generator: random.Random) -> tuple[Sample, ...]:
+    timezones: list[tzinfo | None] = [None, timezone.utc, timezone(timedelta(hours=3))]
+    valid_timezone = next((tz for tz in timezones if _has_valid_timezone(type_, tz)), None)
+    value_min = type_.VALUE_MIN.value if type_.VALUE_MIN is not None else DATETIME_MIN.replace(tzinfo=valid_timezone)
+    value_max = type_.VALUE_MAX.value if type_.VALUE_MAX is not None else DATETIME_MAX.replace(tzinfo=valid_timezone)
+
+    def create_typical(generator: random.Random) -> datetime:
+        return value_min + (value_max - value_min) * generator.random()
+
+    samples = _generate_typical(type_, generator, create_typical)
+    for name, limit in [("VALUE_MIN", type_.VALUE_MIN), ("VALUE_MAX", type_.VALUE_MAX)]:
+        if limit is None:
+            continue
+        for offset in (-1, 0, 1):
+            try:
+                value = limit.value + timedelta(microseconds=offset)
+            except OverflowError:
+                # limit is the earliest or the latest datetime, so there is nothing beyond it
+                continue
+            samples.append(Sample("boundary", f"{name} {offset:+} microsecond", value))
+    samples.extend([
+        Sample("adversarial", "earliest datetime", datetime.min.replace(tzinfo=valid_timezone)),
+        Sample("adversarial", "latest datetime", datetime.max.replace(tzinfo=valid_timezone)),
+    ])
+    samples.extend(
+        Sample("adversarial", f"timezone {tz}", value_min.replace(tzinfo=tz))
+        for tz in timezones
+        if tz is not valid_timezone
+    )
+    return tuple(samples)
+
+
+def _has_valid_timezone(type_: type[DatetimeType], tz: tzinfo | None) -> bool:
+    try:
+        type_.validate_timezone(DATETIME_MIN.replace(tzinfo=tz))
+    except ValidationError:
+        return False
+    return True
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import pkgutil
+import re
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+import wlss
+from wlss.core.types import AwareDatetime, DatetimeType, Int, NaiveDatetime, Str, Type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from datetime import datetime
+
+
+# PostgreSQL regular expressions don't allow bounds of repetition greater than this value
+SQL_REGEXP_BOUND_MAX = 255
+
+# classes which declare methods checking rules of types, rules checked by overridden methods cannot be exported
+_INT_RULES = {"VALUE_MIN": (Int, "validate_value_min"), "VALUE_MAX": (Int, "validate_value_max")}
+_STR_RULES = {
+    "LENGTH_MIN": (Str, "validate_length_min"),
+    "LENGTH_MAX": (Str, "validate_length_max"),
+    "REGEXP": (Str, "validate_regexp"),
+}
+
+
+@dataclass(frozen=True)
+class Inexact:
+    """Rule which cannot be represented exactly by the export target."""
+
+    rule: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class JsonSchemaExport:
+    schema: dict[str, object]
+    inexact: tuple[Inexact, ...]
+
+
+@dataclass(frozen=True)
+class SqlCheckExport:
+    check: str
+    inexact: tuple[Inexact, ...]
+
+
+def iter_types() -> Iterator[type[Type[Any]]]:
+    """Yield concrete types declared in 'wlss' lib ordered by their names.
+
+    All 'wlss.<domain>.types' modules are imported beforehand so every domain type is registered as a subclass.
+    """
+    for package in [module.name for module in pkgutil.iter_modules(wlss.__path__) if module.ispkg]:
+        importlib.import_module(f"{wlss.__name__}.{package}.types")
+
+    types: set[type[Type[Any]]] = set()
+    pending: list[type[Type[Any]]] = Type.__subclasses__()
+    while pending:
+        type_ = pending.pop()
+        pending.extend(type_.__subclasses__())
+        if type_.__module__.startswith(f"{wlss.__name__}.") and not inspect.isabstract(type_):
+            types.add(type_)
+    yield from sorted(types, key=lambda type_: type_.__name__)
+
+
+def export_json_schema(type_: type[Type[Any]]) -> JsonSchemaExport:
+    """Export validation rules of the type as JSON Schema."""
+    if issubclass(type_, Int):
+        return _export_int_json_schema(type_)
+    if issubclass(type_, Str):
+        return _export_str_json_schema(type_)
+    if issubclass(type_, DatetimeType):
+        return _export_datetime_json_schema(type_)
+    msg = f"{type_.__name__} cannot be exported."
+    raise TypeError(msg)
+
+
+def export_sql_check(type_: type[Type[Any]], column: str) -> SqlCheckExport:
+    """Export validation rules of the type as PostgreSQL CHECK constraint for the given column."""
+    if issubclass(type_, Int):
+        return _export_int_sql_check(type_, column)
+    if issubclass(type_, Str):
+        return _export_str_sql_check(type_, column)
+    if issubclass(type_, DatetimeType):
+        return _export_datetime_sql_check(type_, column)
+    msg = f"{type_.__name__} cannot be exported."
+    raise TypeError(msg)
+
+
+def _export_int_json_schema(type_: type[Int]) -> JsonSchemaExport:
+    schema: dict[str, object] = {"title": type_.__name__, "type": "integer"}
+    inexact = _find_overridden_rules(type_, Int, _INT_RULES)
+    overridden = {rule.rule for rule in inexact}
+    if type_.VALUE_MIN is not None and "VALUE_MIN" not in overridden:
+        schema["minimum"] = type_.VALUE_MIN.value
+    if type_.VALUE_MAX is not None and "VALUE_MAX" not in overridden:
+        schema["maximum"] = type_.VALUE_MAX.value
+    return JsonSchemaExport(schema=schema, inexact=tuple(inexact))
+
+
+def _export_str_json_schema(type_: type[Str]) -> JsonSchemaExport:
+    # both JSON Schema and python count string length in unicode code points
+    schema: dict[str, object] = {"title": type_.__name__, "type": "string"}
+    inexact = _find_overridden_rules(type_, Str, _STR_RULES)
+    overridden = {rule.rule for rule in inexact}
+    if "LENGTH_MIN" not in overridden:
+        schema["minLength"] = type_.LENGTH_MIN.value
+    if type_.LENGTH_MAX is not None and "LENGTH_MAX" not in overridden:
+        schema["maxLength"] = type_.LENGTH_MAX.value
+    if type_.REGEXP is not None and "REGEXP" not in overridden:
+        dotall = bool(type_.REGEXP.flags & re.DOTALL)
+        pattern, reasons = _translate_regexp(type_.REGEXP, dot=r"[\s\S]" if dotall else r"[^\n]")
+        # JSON Schema "pattern" is not anchored while python validation uses "fullmatch"
+        schema["pattern"] = f"^(?:{pattern})$"
+        inexact.extend(Inexact(rule="REGEXP", reason=reason) for reason in reasons)
+    return JsonSchemaExport(schema=schema, inexact=tuple(inexact))
+
+
+def _export_datetime_json_schema(type_: type[DatetimeType]) -> JsonSchemaExport:
+    schema: dict[str, object] = {"title": type_.__name__, "type": "string"}
+    inexact = _find_overridden_rules(type_, DatetimeType, _datetime_rules(type_))
+    overridden = {rule.rule for rule in inexact}
+    if issubclass(type_, AwareDatetime) and "TIMEZONE" not in overridden:
+        # RFC 3339 "date-time" always has an offset, so it matches timezone-aware datetime
+        schema["format"] = "date-time"
+        inexact.append(Inexact(
+            rule="TIMEZONE",
+            reason="JSON Schema 'format' is only an annotation unless format-assertion vocabulary is enabled.",
+        ))
+        if type_.TIMEZONE is not None:
+            inexact.append(Inexact(rule="TIMEZONE", reason="JSON Schema cannot restrict datetime offset."))
+    elif issubclass(type_, NaiveDatetime) and "TIMEZONE" not in overridden:
+        inexact.append(Inexact(rule="TIMEZONE", reason="JSON Schema has no format for timezone-naive datetime."))
+    if type_.VALUE_MIN is not None and "VALUE_MIN" not in overridden:
+        inexact.append(Inexact(rule="VALUE_MIN", reason="JSON Schema cannot compare datetime values."))
+    if type_.VALUE_MAX is not None and "VALUE_MAX" not in overridden:
+        inexact.append(Inexact(rule="VALUE_MAX", reason="JSON Schema cannot compare datetime values."))
+    return JsonSchemaExport(schema=schema, inexact=tuple(inexact))
+
+
+def _export_int_sql_check(type_: type[Int], column: str) -> SqlCheckExport:
+    column = _quote_identifier(column)
+    conditions = []
+    inexact = _find_overridden_rules(type_, Int, _INT_RULES)
+    overridden = {rule.rule for rule in inexact}
+    if type_.VALUE_MIN is not None and "VALUE_MIN" not in overridden:
+        conditions.append(f"{column} >= {type_.VALUE_MIN.value}")
+    if type_.VALUE_MAX is not None and "VALUE_MAX" not in overridden:
+        conditions.append(f"{column} <= {type_.VALUE_MAX.value}")
+    return SqlCheckExport(check=_build_check(conditions), inexact=tuple(inexact))
+
+
+def _export_str_sql_check(type_: type[Str], column: str) -> SqlCheckExport:
+    column = _quote_identifier(column)
+    conditions = []
+    inexact = _find_overridden_rules(type_, Str, _STR_RULES)
+    overridden = {rule.rule for rule in inexact}
+    # "char_length" counts characters (not bytes) as python "len" does
+    if "LENGTH_MIN" not in overridden:
+        conditions.append(f"char_length({column}) >= {type_.LENGTH_MIN.value}")
+    if type_.LENGTH_MAX is not None and "LENGTH_MAX" not in overridden:
+        conditions.append(f"char_length({column}) <= {type_.LENGTH_MAX.value}")
+    if type_.REGEXP is not None and "REGEXP" not in overridden:
+        dotall = bool(type_.REGEXP.flags & re.DOTALL)
+        # "." in PostgreSQL regular expressions matches newlines as python "." does with "re.DOTALL" flag
+        pattern, reasons = _translate_regexp(
+            type_.REGEXP, dot="." if dotall else r"[^\n]", bound_max=SQL_REGEXP_BOUND_MAX,
+        )
+        if any(reason.startswith("Repetition bound") for reason in reasons):
+            # such expression would be rejected by PostgreSQL, so it's better to omit it at all
+            reasons = [*reasons, "Regular expression is omitted."]
+        else:
+            conditions.append(f"{column} ~ {_quote(f'^(?:{pattern})$')}")
+        inexact.extend(Inexact(rule="REGEXP", reason=reason) for reason in reasons)
+    return SqlCheckExport(check=_build_check(conditions), inexact=tuple(inexact))
+
+
+def _export_datetime_sql_check(type_: type[DatetimeType], column: str) -> SqlCheckExport:
+    column = _quote_identifier(column)
+    conditions = []
+    inexact = _find_overridden_rules(type_, DatetimeType, _datetime_rules(type_))
+    overridden = {rule.rule for rule in inexact}
+    if "TIMEZONE" not in overridden:
+        inexact.insert(0, Inexact(rule="TIMEZONE", reason="Timezone can be enforced only by column type."))
+    if type_.VALUE_MIN is not None and "VALUE_MIN" not in overridden:
+        conditions.append(f"{column} >= {_datetime_literal(type_.VALUE_MIN.value)}")
+    if type_.VALUE_MAX is not None and "VALUE_MAX" not in overridden:
+        conditions.append(f"{column} <= {_datetime_literal(type_.VALUE_MAX.value)}")
+    return SqlCheckExport(check=_build_check(conditions), inexact=tuple(inexact))
+
+
+def _datetime_rules(type_: type[DatetimeType]) -> dict[str, tuple[type, str]]:
+    # "validate_timezone" is implemented by subclasses, so it's compared with the implementation of the nearest one
+    timezone_base = AwareDatetime if issubclass(type_, AwareDatetime) else NaiveDatetime
+    return {
+        "TIMEZONE": (timezone_base, "validate_timezone"),
+        "VALUE_MIN": (DatetimeType, "validate_value_min"),
+        "VALUE_MAX": (DatetimeType, "validate_value_max"),
+    }
+
+
+def _is_overridden(type_: type, base: type, method: str = "validate") -> bool:
+    return getattr(type_, method).__func__ is not getattr(base, method).__func__
+
+
+def _find_overridden_rules(
+    type_: type[Type[Any]],
+    base: type,
+    rules: Mapping[str, tuple[type, str]],
+) -> list[Inexact]:
+    """Return rules of the type which are checked by overridden methods, all of them if "validate" is overridden."""
+    if _is_overridden(type_, base):
+        return [Inexact(rule=rule, reason="Overridden 'validate' method cannot be exported.") for rule in rules]
+    inexact = []
+    for rule, (rule_base, method) in rules.items():
+        if _is_overridden(type_, rule_base, method):
+            inexact.append(Inexact(rule=rule, reason=f"Overridden '{method}' method cannot be exported."))
+    return inexact
+
+
+def _build_check(conditions: list[str]) -> str:
+    return f"CHECK ({' AND '.join(conditions) or 'TRUE'})"
+
+
+def _quote(value: str) -> str:
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def _quote_identifier(name: str) -> str:
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _datetime_literal(value: datetime) -> str:
+    if value.tzinfo is None:
+        return f"TIMESTAMP {_quote(value.isoformat(sep=' '))}"
+    return f"TIMESTAMP WITH TIME ZONE {_quote(value.isoformat(sep=' '))}"
+
+
+def _translate_regexp(  # noqa: C901
+    regexp: re.Pattern[str],
+    *,
+    dot: str,
+    bound_max: int | None = None,
+) -> tuple[str, list[str]]:
+    """Translate python regular expression to the common subset of ECMA-262 and PostgreSQL syntax.
+
+    Returns translated pattern and list of reasons why the translation is not exact.
+    """
+    pattern = regexp.pattern
+    reasons = []
+    if regexp.flags & ~(re.UNICODE | re.DOTALL):
+        reasons.append("Only re.DOTALL flag can be exported.")
+
+    result = []
+    in_class = False
+    class_start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escape = pattern[i:i + 2]
+            if escape[1:] in set("dDwWsSbBAZ"):
+                reasons.append(f"'{escape}' has different meaning outside of python.")
+            result.append(escape)
+            i += 2
+            continue
+        if in_class:
+            # "]" right after "[" or "[^" is a literal character
+            if char == "]" and i > class_start:
+                in_class = False
+            result.append(char)
+        elif char == "[":
+            in_class = True
+            class_start = i + 2 if pattern[i + 1:i + 2] == "^" else i + 1
+            result.append(char)
+        elif char == ".":
+            result.append(dot)
+        elif char == "(" and pattern[i + 1:i + 2] == "?" and pattern[i + 2:i + 3] != ":":
+            reasons.append("Only non-capturing '(?:...)' groups can be exported.")
+            result.append(char)
+        elif char == "{" and (bound := re.match(r"\{(\d*)(,?)(\d*)\}", pattern[i:])) and bound.group() != "{}":
+            minimum, comma, maximum = bound.groups()
+            numbers = [int(number) for number in (minimum, maximum) if number]
+            if bound_max is not None and any(number > bound_max for number in numbers):
+                reasons.append(f"Repetition bound should not be greater than {bound_max}.")
+            # python allows to omit lower bound, while other dialects read "{,n}" as literal characters
+            result.append(f"{{{minimum or 0}{comma}{maximum}}}")
+            i += len(bound.group())
+            continue
+        else:
+            result.append(char)
+        i += 1
+    return "".join(result), reasons
@@ -0,0 +1,111 @@
+"""Measurement of validation latency over generated corpus (see wlss.core.corpus for details)."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+from wlss.core.corpus import generate_corpus
+from wlss.core.exceptions import ValidationError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Self
+
+    from wlss.core.corpus import Category, Sample
+    from wlss.core.types import Type
+
+
+# validation of a single value should not take longer than this number of nanoseconds
+BUDGET_NS = 50_000
+# number of times every sample is validated
+REPEAT = 20
+
+
+@dataclass(frozen=True)
+class Outlier:
+    """Sample which is validated longer than the budget even in its fastest run."""
+
+    type_name: str
+    sample: Sample
+    latency_ns: int
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Percentiles of validation latency of the type over all runs of samples of the category."""
+
+    type_name: str
+    category: Category
+    p50_ns: int
+    p99_ns: int
+    max_ns: int
+
+
+@dataclass(frozen=True)
+class LatencyReport:
+    budget_ns: int
+    latencies: tuple[Latency, ...]
+    outliers: tuple[Outlier, ...]
+
+    def format(self: Self) -> str:
+        lines = [f"{'type':<24}{'category':<14}{'p50, us':>10}{'p99, us':>10}{'max, us':>10}"]
+        lines.extend(
+            f"{latency.type_name:<24}{latency.category:<14}"
+            f"{latency.p50_ns / 1000:>10.1f}{latency.p99_ns / 1000:>10.1f}{latency.max_ns / 1000:>10.1f}"
+            for latency in self.latencies
+        )
+        lines.extend(
+            f"OUTLIER {outlier.type_name} {outlier.sample.category} ({outlier.sample.description}): "
+            f"{outlier.latency_ns / 1000:.1f} us > {self.budget_ns / 1000:.1f} us"
+            for outlier in self.outliers
+        )
+        return "\n".join(lines)
+
+
+def measure_latency(
+    types: Iterable[type[Type[Any]]],
+    budget_ns: int = BUDGET_NS,
+    repeat: int = REPEAT,
+    seed: int = 0,
+) -> LatencyReport:
+    """Validate corpus of every type and report latency percentiles per type and category of samples."""
+    latencies: list[Latency] = []
+    outliers: list[Outlier] = []
+    for type_ in types:
+        runs: dict[Category, list[int]] = {}
+        for sample in generate_corpus(type_, seed):
+            # warm-up run isn't measured, so the first run doesn't pay for e.g. lazy initialization of caches
+            _measure(type_, sample.value)
+            sample_runs = [_measure(type_, sample.value) for _ in range(repeat)]
+            runs.setdefault(sample.category, []).extend(sample_runs)
+            # the fastest run is used, so a single slow run caused by e.g. garbage collection isn't reported
+            if min(sample_runs) > budget_ns:
+                outliers.append(Outlier(type_.__name__, sample, min(sample_runs)))
+        latencies.extend(
+            Latency(
+                type_name=type_.__name__,
+                category=category,
+                p50_ns=_percentile(category_runs, 50),
+                p99_ns=_percentile(category_runs, 99),
+                max_ns=max(category_runs),
+            )
+            for category, category_runs in runs.items()
+        )
+    return LatencyReport(budget_ns=budget_ns, latencies=tuple(latencies), outliers=tuple(outliers))
+
+
+def _measure(type_: type[Type[Any]], value: object) -> int:
+    start = time.perf_counter_ns()
+    try:  # noqa: SIM105 (contextlib.suppress would add its own overhead to the measurement)
+        type_(value)
+    except ValidationError:
+        pass
+    return time.perf_counter_ns() - start
+
+
+def _percentile(values: list[int], percent: int) -> int:
+    """Return percentile of values by nearest-rank method."""
+    values = sorted(values)
+    return values[max(0, -(-len(values) * percent // 100) - 1)]
@@ -0,0 +1,160 @@
+"""Integration with pydantic (optional dependency, install 'wlss[pydantic]' to use it).
+
+Rules of types are translated into constraints of pydantic-core schemas, so they are checked by pydantic-core
+compiled validators. Rules which cannot be translated are checked by python validators of the type.
+
+Schemas are strict, so pydantic doesn't coerce values which python validation would reject (e.g. "42" or True
+are not accepted as Int). The only conversion is parsing of JSON strings as datetime, since JSON has no datetime type.
+"""
+from __future__ import annotations
+
+import re
+from functools import cache
+from typing import Any, Literal, TYPE_CHECKING
+
+from pydantic_core import core_schema, SchemaError, SchemaValidator
+
+from wlss.core.types import AwareDatetime, DatetimeType, Int, NaiveDatetime, Str, Type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic_core import CoreSchema
+
+
+# constructions which have different meaning in python and in rust "regex" crate used by pydantic-core
+_RUST_REGEXP_INCOMPATIBLE = re.compile(r"\$|--|&&|~~|\[[^\]]*\[")
+
+
+@cache
+def build_core_schema(type_: type[Type[Any]]) -> CoreSchema:
+    """Build pydantic-core schema which validates value and creates object of the type."""
+    if issubclass(type_, Int):
+        schema, rules = _build_int_schema(type_)
+    elif issubclass(type_, Str):
+        schema, rules = _build_str_schema(type_)
+    elif issubclass(type_, DatetimeType):
+        schema, rules = _build_datetime_schema(type_)
+    else:
+        msg = f"{type_.__name__} cannot be used with pydantic."
+        raise TypeError(msg)
+
+    def create(value: Any) -> Type[Any]:  # noqa: ANN401
+        for rule in rules:
+            value = rule(value)
+        return type_._from_validated(value)  # noqa: SLF001
+
+    def validate(value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Type[Any]:  # noqa: ANN401
+        if type(value) is type_:
+            # object may have been created by "lazy", so it's validated before it gets into a model
+            return value.force()
+        if isinstance(value, Type):
+            # object of another type (even of a subclass, which may loosen rules) is validated as its value
+            value = value.value
+        # only the value itself is validated by the schema, so the error of its first failed rule is reported alone
+        return create(handler(value))
+
+    return core_schema.json_or_python_schema(
+        # JSON has no objects of the type, so JSON values don't need an extra check
+        json_schema=core_schema.no_info_after_validator_function(create, schema),
+        python_schema=core_schema.no_info_wrap_validator_function(validate, schema),
+        serialization=core_schema.plain_serializer_function_ser_schema(_serialize, info_arg=True),
+    )
+
+
+def _serialize(value: Type[Any], info: core_schema.SerializationInfo) -> Any:  # noqa: ANN401
+    # objects are kept as they are in python mode, so they are serialized to their values only in JSON
+    return value.value if info.mode_is_json() else value
+
+
+def _is_overridden(type_: type, base: type, method: str = "validate") -> bool:
+    return getattr(type_, method).__func__ is not getattr(base, method).__func__
+
+
+def _build_int_schema(type_: type[Int]) -> tuple[CoreSchema, list[Callable[[Any], Any]]]:
+    if _is_overridden(type_, Int):
+        return core_schema.int_schema(strict=True), [type_.validate]
+    rules: list[Callable[[Any], Any]] = []
+    value_max = value_min = None
+    if _is_overridden(type_, Int, "validate_value_max"):
+        rules.append(type_.validate_value_max)
+    elif type_.VALUE_MAX is not None:
+        value_max = type_.VALUE_MAX.value
+    if _is_overridden(type_, Int, "validate_value_min"):
+        rules.append(type_.validate_value_min)
+    elif type_.VALUE_MIN is not None:
+        value_min = type_.VALUE_MIN.value
+    return core_schema.int_schema(ge=value_min, le=value_max, strict=True), rules
+
+
+def _build_str_schema(type_: type[Str]) -> tuple[CoreSchema, list[Callable[[Any], Any]]]:
+    if _is_overridden(type_, Str):
+        return core_schema.str_schema(strict=True), [type_.validate]
+    rules: list[Callable[[Any], Any]] = []
+    length_max = pattern = None
+    if _is_overridden(type_, Str, "validate_length_max"):
+        rules.append(type_.validate_length_max)
+    elif type_.LENGTH_MAX is not None:
+        length_max = type_.LENGTH_MAX.value
+    if _is_overridden(type_, Str, "validate_length_min"):
+        rules.append(type_.validate_length_min)
+        length_min = None
+    else:
+        length_min = type_.LENGTH_MIN.value
+    if _is_overridden(type_, Str, "validate_regexp"):
+        rules.append(type_.validate_regexp)
+    elif type_.REGEXP is not None:
+        pattern = _translate_regexp(type_.REGEXP)
+        if pattern is None:
+            rules.append(type_.validate_regexp)
+    # both pydantic-core and python count string length in unicode code points
+    schema = core_schema.str_schema(min_length=length_min, max_length=length_max, pattern=pattern, strict=True)
+    return schema, rules
+
+
+def _translate_regexp(regexp: re.Pattern[str]) -> str | None:
+    """Translate python regular expression to the syntax of rust "regex" crate or return None if it's impossible."""
+    if regexp.flags & ~(re.UNICODE | re.DOTALL) or _RUST_REGEXP_INCOMPATIBLE.search(regexp.pattern):
+        return None
+    # pydantic-core searches for the pattern while python validation uses "fullmatch"
+    flags = "s" if regexp.flags & re.DOTALL else ""
+    pattern = f"^(?{flags}:{regexp.pattern})$"
+    try:
+        SchemaValidator(core_schema.str_schema(pattern=pattern))
+    except SchemaError:
+        return None
+    return pattern
+
+
+def _build_datetime_schema(type_: type[DatetimeType]) -> tuple[CoreSchema, list[Callable[[Any], Any]]]:
+    if _is_overridden(type_, DatetimeType):
+        return core_schema.datetime_schema(strict=True), [type_.validate]
+    rules: list[Callable[[Any], Any]] = []
+    tz_constraint: Literal["aware", "naive"] | None
+    if issubclass(type_, NaiveDatetime) and not _is_overridden(type_, NaiveDatetime, "validate_timezone"):
+        tz_constraint = "naive"
+    elif (
+        issubclass(type_, AwareDatetime)
+        and not _is_overridden(type_, AwareDatetime, "validate_timezone")
+        and type_.TIMEZONE is None
+    ):
+        tz_constraint = "aware"
+    else:
+        # pydantic-core compares only utc offsets of datetime, while python validation compares tzinfo objects
+        tz_constraint = None
+        rules.append(type_.validate_timezone)
+    value_max = value_min = None
+    if _is_overridden(type_, DatetimeType, "validate_value_max"):
+        rules.append(type_.validate_value_max)
+    elif type_.VALUE_MAX is not None:
+        value_max = type_.VALUE_MAX.value
+    if _is_overridden(type_, DatetimeType, "validate_value_min"):
+        rules.append(type_.validate_value_min)
+    elif type_.VALUE_MIN is not None:
+        value_min = type_.VALUE_MIN.value
+    schema = core_schema.datetime_schema(
+        ge=value_min, le=value_max, tz_constraint=tz_constraint, strict=True,
+    )
+    return schema, rules
+
@@ -0,0 +1,266 @@
+"""Read-only lookup tables of validated values stored in memory-mapped files.
+
+Table is built once (e.g. by deployment script) and then opened by every worker process.
+Opened tables share pages of the file through the page cache, so workers don't keep their own copies of
+the data, and opening a table costs the same regardless of its size since nothing is parsed upfront.
+
+File layout (all integers are little-endian):
+
+    header    magic, length of type name, number of entries, number of buckets
+    type name full name of the type of values encoded in utf-8, padded to 8 bytes
+    buckets   open addressing hash index, every bucket is an offset of entry or 0 if bucket is empty
+    entries   length of encoded value followed by encoded value
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Generic, TYPE_CHECKING, TypeVar
+
+from typing_extensions import override
+
+from wlss.core.arrays import ITEM_MAX, ITEM_MIN
+from wlss.core.exceptions import ValidationError
+from wlss.core.types import Int, Str, Type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+    from typing import Self
+
+
+MAGIC = b"WLSSTBL1"
+
+_HEADER = struct.Struct("<8sIQQ")
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<q")
+_INT = struct.Struct("<q")
+
+
+TypeT = TypeVar("TypeT", bound=Type[Any])
+IntT = TypeVar("IntT", bound=Int)
+StrT = TypeVar("StrT", bound=Str)
+
+
+class Table(ABC, Generic[TypeT]):
+    """Read-only set of validated values stored in a memory-mapped file.
+
+    Use "build" to create a file of the table and "open" to use it. Values are validated only on build,
+    lookups create objects of TYPE directly from the mapped data.
+    """
+
+    TYPE: type[TypeT]
+
+    def __init__(self: Self, path: str | os.PathLike[str], mapping: mmap.mmap) -> None:
+        self.path = path
+        self._mapping = mapping
+        if not self._has_valid_header(mapping):
+            mapping.close()
+            msg = f"{os.fspath(path)} is not a table of {self._type_name()}."
+            raise ValueError(msg)
+        self._view = memoryview(mapping)
+        _, name_length, self._count, bucket_count = _HEADER.unpack_from(self._view)
+        name_end = _HEADER.size + name_length
+        buckets_start = _align(name_end)
+        self._entries_start = buckets_start + bucket_count * _OFFSET.size
+        self._buckets = self._view[buckets_start:self._entries_start].cast("q")
+
+    @classmethod
+    def build(cls: type[Self], path: str | os.PathLike[str], values: Iterable[Any]) -> None:
+        """Validate values and write the table to the file.
+
+        The file is replaced atomically, so processes which have already opened the previous version keep using it.
+        """
+        payloads = list(dict.fromkeys(cls._encode(cls._validate(value)) for value in values))
+        bucket_count = 1
+        while bucket_count < len(payloads) * 2:
+            # at least half of buckets are empty, so probing sequences stay short
+            bucket_count *= 2
+
+        name = cls._type_name().encode()
+        entries_start = _align(_HEADER.size + len(name)) + bucket_count * _OFFSET.size
+        buckets = [0] * bucket_count
+        entries = bytearray()
+        for payload in payloads:
+            position = zlib.crc32(payload) & (bucket_count - 1)
+            while buckets[position]:
+                position = (position + 1) & (bucket_count - 1)
+            buckets[position] = entries_start + len(entries)
+            entries += _LENGTH.pack(len(payload)) + payload
+
+        header = _HEADER.pack(MAGIC, len(name), len(payloads), bucket_count) + name
+        # temporary file has a unique name, so concurrent builds of the same table don't overwrite each other
+        with tempfile.NamedTemporaryFile(dir=Path(path).parent, prefix=f"{Path(path).name}.", delete=False) as file:
+            try:
+                file.write(header.ljust(_align(len(header)), b"\0"))
+                file.write(struct.pack(f"<{bucket_count}q", *buckets))
+                file.write(entries)
+                # temporary files are created with 0600 mode, while the table has to be readable as a regular file is,
+                # e.g. by workers running as another user
+                Path(file.name).chmod(0o666 & ~_get_umask())
+                # data is flushed to disk before replacement, so a crash never leaves a truncated table
+                file.flush()
+                os.fsync(file.fileno())
+            except BaseException:
+                Path(file.name).unlink()
+                raise
+        Path(file.name).replace(os.fspath(path))
+
+    @classmethod
+    def open(cls: type[Self], path: str | os.PathLike[str]) -> Self:
+        """Map the file of the table into memory.
+
+        Tables opened before fork are shared by child processes as well.
+        """
+        with open(path, "rb") as file:  # noqa: PTH123
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(path, mapping)
+
+    @classmethod
+    def _type_name(cls: type[Self]) -> str:
+        return f"{cls.TYPE.__module__}.{cls.TYPE.__qualname__}"
+
+    @classmethod
+    def _has_valid_header(cls: type[Self], mapping: mmap.mmap) -> bool:
+        name = cls._type_name().encode()
+        if len(mapping) < _HEADER.size + len(name):
+            return False
+        magic, name_length, _, _ = _HEADER.unpack_from(mapping)
+        return magic == MAGIC and mapping[_HEADER.size:_HEADER.size + name_length] == name
+
+    @classmethod
+    def _validate(cls: type[Self], value: Any) -> Any:  # noqa: ANN401
+        return cls.TYPE(value).value
+
+    @staticmethod
+    @abstractmethod
+    def _encode(value: Any) -> bytes:  # noqa: ANN401
+        raise NotImplementedError  # pragma: no cover
+
+    @staticmethod
+    @abstractmethod
+    def _decode(payload: memoryview) -> Any:  # noqa: ANN401
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _accepts(self: Self, value: object) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+    def get(self: Self, value: object) -> TypeT | None:
+        """Return object of TYPE if value is present in the table, otherwise return None."""
+        if isinstance(value, Type):
+            if not isinstance(value, self.TYPE):
+                return None
+            value = value.value
+        if not self._accepts(value) or not self._contains(self._encode(value)):
+            return None
+        return self.TYPE._from_validated(value)  # noqa: SLF001
+
+    def _contains(self: Self, payload: bytes) -> bool:
+        mask = len(self._buckets) - 1
+        position = zlib.crc32(payload) & mask
+        while offset := self._buckets[position]:
+            (length, ) = _LENGTH.unpack_from(self._view, offset)
+            start = offset + _LENGTH.size
+            if length == len(payload) and self._view[start:start + length] == payload:
+                return True
+            position = (position + 1) & mask
+        return False
+
+    def close(self: Self) -> None:
+        # mapping cannot be closed while there are views of it
+        self._buckets.release()
+        self._view.release()
+        self._mapping.close()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __contains__(self: Self, value: object) -> bool:
+        return self.get(value) is not None
+
+    def __len__(self: Self) -> int:
+        return self._count  # type: ignore[no-any-return]
+
+    def __iter__(self: Self) -> Iterator[TypeT]:
+        offset = self._entries_start
+        for _ in range(self._count):
+            (length, ) = _LENGTH.unpack_from(self._view, offset)
+            offset += _LENGTH.size
+            yield self.TYPE._from_validated(self._decode(self._view[offset:offset + length]))  # noqa: SLF001
+            offset += length
+
+    @override
+    def __repr__(self: Self) -> str:
+        return f"{self.__class__.__name__}.open({os.fspath(self.path)!r})"
+
+
+class IntTable(Table[IntT]):
+    """Table of validated integers, values are stored as signed 64-bit machine integers."""
+
+    @override
+    @classmethod
+    def _validate(cls: type[Self], value: Any) -> Any:
+        value = super()._validate(value)
+        if not ITEM_MIN <= value <= ITEM_MAX:
+            msg = f"{cls.__name__} value should be in range [{ITEM_MIN}, {ITEM_MAX}]."
+            raise ValidationError(msg)
+        return value
+
+    @override
+    @staticmethod
+    def _encode(value: int) -> bytes:
+        return _INT.pack(value)
+
+    @override
+    @staticmethod
+    def _decode(payload: memoryview) -> int:
+        return _INT.unpack(payload)[0]  # type: ignore[no-any-return]
+
+    @override
+    def _accepts(self: Self, value: object) -> bool:
+        return isinstance(value, int) and ITEM_MIN <= value <= ITEM_MAX
+
+
+class StrTable(Table[StrT]):
+    """Table of validated strings, values are stored encoded in utf-8."""
+
+    @override
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        # surrogates are allowed in python strings, so they have to be encoded as well
+        return value.encode(errors="surrogatepass")
+
+    @override
+    @staticmethod
+    def _decode(payload: memoryview) -> str:
+        return str(payload, errors="surrogatepass")
+
+    @override
+    def _accepts(self: Self, value: object) -> bool:
+        return isinstance(value, str)
+
+
+def _get_umask() -> int:
+    # umask can only be read by setting it, so it's restored immediately
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _align(size: int) -> int:
+    return (size + _OFFSET.size - 1) // _OFFSET.size * _OFFSET.size
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Generic, TYPE_CHECKING, TypeVar
+from typing import Any, Generic, NamedTuple, TYPE_CHECKING, TypeVar
+from weakref import WeakKeyDictionary
 
 from typing_extensions import override
 
@@ -15,11 +17,35 @@ if TYPE_CHECKING:
     from datetime import timezone
     from typing import Self
 
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
 
 T = TypeVar("T")
 
 
+# number of lazy objects created and forced for every type (see Type.lazy for usage),
+# types are weakly referenced, so dynamically created types can be garbage collected
+_LAZY_CREATED: WeakKeyDictionary[type[Type[Any]], int] = WeakKeyDictionary()
+_LAZY_FORCED: WeakKeyDictionary[type[Type[Any]], int] = WeakKeyDictionary()
+# counters are updated by read-modify-write, so concurrent updates would lose increments without the lock
+_LAZY_STATS_LOCK = threading.Lock()
+# marker of absent raw value of lazy object (see Type.force for usage)
+_MISSING = object()
+
+
+class LazyStats(NamedTuple):
+    created: int
+    forced: int
+
+    @property
+    def unforced(self: Self) -> int:
+        return self.created - self.forced
+
+
 class Type(ABC, Generic[T]):
+    _raw: T | Type[T]
+
     def __init__(self: Self, value: T | Type[T]) -> None:
         if isinstance(value, Type):
             value = value.value
@@ -32,14 +58,68 @@ class Type(ABC, Generic[T]):
                 raise e.with_traceback(NO_TRACEBACK) from None  # pragma: no cover
             raise e
 
+    @classmethod
+    def lazy(cls: type[Self], value: T | Type[T]) -> Self:
+        """Create object which validates its value on first access to it.
+
+        Validation is triggered by "value", "__eq__", "__hash__" or explicit "force" call.
+        """
+        obj = cls.__new__(cls)
+        obj._raw = value  # noqa: SLF001
+        with _LAZY_STATS_LOCK:
+            _LAZY_CREATED[cls] = _LAZY_CREATED.get(cls, 0) + 1
+        return obj
+
+    @classmethod
+    def _from_validated(cls: type[Self], value: T) -> Self:
+        obj = cls.__new__(cls)
+        obj._value = value  # noqa: SLF001
+        return obj
+
+    @classmethod
+    def lazy_stats(cls: type[Type[T]]) -> LazyStats:
+        with _LAZY_STATS_LOCK:
+            return LazyStats(created=_LAZY_CREATED.get(cls, 0), forced=_LAZY_FORCED.get(cls, 0))
+
+    @classmethod
+    def reset_lazy_stats(cls: type[Type[T]]) -> None:
+        with _LAZY_STATS_LOCK:
+            _LAZY_CREATED.pop(cls, None)
+            _LAZY_FORCED.pop(cls, None)
+
+    def force(self: Self) -> Self:
+        if "_value" not in self.__dict__:
+            raw = self.__dict__.get("_raw", _MISSING)
+            if raw is _MISSING:
+                # object has been forced by another thread since the check above
+                return self
+            Type.__init__(self, raw)
+            # another thread may force the object at the same time, only one of them removes raw value
+            if self.__dict__.pop("_raw", _MISSING) is not _MISSING:
+                with _LAZY_STATS_LOCK:
+                    _LAZY_FORCED[self.__class__] = _LAZY_FORCED.get(self.__class__, 0) + 1
+        return self
+
     @classmethod
     @abstractmethod
     def validate(cls: type[Type[T]], value: T) -> T:
         raise NotImplementedError  # pragma: no cover
 
+    @classmethod
+    def __get_pydantic_core_schema__(cls: type[Type[T]], source: object, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # pydantic is an optional dependency, so integration with it is imported only when pydantic uses the type
+        from wlss.core.pydantic import build_core_schema
+
+        return build_core_schema(cls)
+
     @property
     def value(self: Self) -> T:
-        return self._value
+        try:
+            return self._value
+        except AttributeError:
+            # object has been created by "lazy" and has not been validated yet
+            self.force()
+            return self._value
 
     @override
     def __eq__(self: Self, other: object) -> bool:
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from wlss.core.arrays import IntArray
+from wlss.file.types import FileSize
+
+
+class FileSizeArray(IntArray[FileSize]):
+    TYPE = FileSize
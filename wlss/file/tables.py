@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from wlss.core.tables import StrTable
+from wlss.file.types import FileName
+
+
+class FileNameTable(StrTable[FileName]):
+    TYPE = FileName
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from wlss.core.arrays import IntArray
+from wlss.shared.types import Id
+
+
+class IdArray(IntArray[Id]):
+    TYPE = Id
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from wlss.core.tables import IntTable
+from wlss.shared.types import Id
+
+
+class IdTable(IntTable[Id]):
+    TYPE = Id